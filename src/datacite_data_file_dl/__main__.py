@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import queue
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from logging import Logger
 from typing import TYPE_CHECKING
 
 from botocore.exceptions import ClientError
 
+from .adaptive import AdaptiveConcurrency
 from .auth import AuthenticationError, CredentialManager
 from .cli import parse_args
 from .config import Config, load_config
@@ -17,21 +20,24 @@ from .download import (
     BUCKET,
     DEFAULT_BUCKET,
     LARGE_DOWNLOAD_THRESHOLD_BYTES,
-    download_file_with_retry,
+    MAX_SMALL_OBJECT_WORKERS,
+    SMALL_OBJECT_THRESHOLD_BYTES,
+    DownloadItem,
+    DownloadResult,
     download_worker,
+    filter_objects,
     get_manifest_metadata,
     get_status_json,
-    list_all_objects,
+    iter_all_objects,
     list_contents,
     parse_size,
-    should_download_file,
+    prepare_output_tree,
 )
 from .exit_codes import ExitCode
 from .interactive import select_download
 from .log import get_logger, setup_logging
 from .output import format_error, format_list, format_status, format_success
 from .progress import AggregateProgress, ProgressTracker
-from .safe_path import PathTraversalError, safe_join
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
@@ -74,6 +80,9 @@ def _authenticate(config: Config, logger: Logger) -> tuple[CredentialManager, "S
             config.username,
             config.password,
             refresh_interval_seconds=config.refresh_interval * 60,
+            max_pool_connections=min(config.workers * 4, MAX_SMALL_OBJECT_WORKERS)
+            if config.workers > 1
+            else config.workers,
         )
         client = cred_manager.get_client()
     except AuthenticationError as e:
@@ -209,11 +218,22 @@ def _build_download_list(
     tracker: ProgressTracker,
     max_size_bytes: int | None,
     logger: Logger,
-) -> tuple[list[dict], int] | int:
+) -> tuple[list[DownloadItem], int] | int:
     bucket = config.bucket or DEFAULT_BUCKET
 
     try:
-        all_objects = list_all_objects(client, prefix, bucket=bucket)
+        # Filter while the listing streams in, so skipped objects are
+        # never buffered even for very large buckets; filter_objects
+        # hoists the per-object overhead (glob compilation, logging
+        # checks) out of the loop
+        to_download, skipped = filter_objects(
+            iter_all_objects(client, prefix, bucket=bucket),
+            prefix,
+            tracker,
+            include_patterns=config.include_patterns,
+            exclude_patterns=config.exclude_patterns,
+            max_size=max_size_bytes,
+        )
     except Exception as e:
         if config.json_output:
             print(format_error("NETWORK_ERROR", str(e), json_output=True))
@@ -221,7 +241,7 @@ def _build_download_list(
             logger.error(f"Failed to list objects: {e}")
         return ExitCode.NETWORK_ERROR
 
-    if not all_objects:
+    if not to_download and not skipped:
         msg = f"No files found under '{prefix}'"
         if config.json_output:
             print(format_error("NOT_FOUND", msg, json_output=True))
@@ -229,83 +249,11 @@ def _build_download_list(
             logger.warning(msg)
         return ExitCode.NOT_FOUND
 
-    to_download = []
-    skipped = 0
-    for obj in all_objects:
-        if should_download_file(
-            key=obj["Key"],
-            size=obj["Size"],
-            tracker=tracker,
-            include_patterns=config.include_patterns,
-            exclude_patterns=config.exclude_patterns,
-            max_size=max_size_bytes,
-        ):
-            to_download.append(obj)
-        else:
-            skipped += 1
-
     return to_download, skipped
 
 
-def _download_sequential(
-    to_download: list[dict],
-    prefix: str,
-    config: Config,
-    tracker: ProgressTracker,
-    cred_manager: CredentialManager,
-    logger: Logger,
-) -> tuple[list[dict], int]:
-    bucket = config.bucket or DEFAULT_BUCKET
-    downloaded = []
-    failed = 0
-
-    for i, obj in enumerate(to_download, 1):
-        key = obj["Key"]
-        relative_path = key[len(prefix) :].lstrip("/") if prefix else key
-        if not relative_path:
-            relative_path = key.split("/")[-1]
-
-        try:
-            local_path = safe_join(config.output_dir, relative_path)
-        except PathTraversalError as e:
-            logger.warning(f"Skipping unsafe path for {key}: {e}")
-            failed += 1
-            continue
-
-        logger.info(f"[{i}/{len(to_download)}] {key}")
-        client = cred_manager.get_client()
-
-        try:
-            download_file_with_retry(
-                client=client,
-                s3_key=key,
-                local_path=local_path,
-                expected_etag=obj["ETag"],
-                retries=config.retries,
-                skip_verify=config.skip_verify,
-                progress=not config.quiet,
-                credential_manager=cred_manager,
-                bucket=bucket,
-            )
-            tracker.mark_complete(key, obj["Size"], obj["ETag"])
-            downloaded.append(
-                {
-                    "path": key,
-                    "size": obj["Size"],
-                    "checksum": obj["ETag"].strip('"'),
-                }
-            )
-        except KeyboardInterrupt:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to download {key}: {e}")
-            failed += 1
-
-    return downloaded, failed
-
-
 def _download_parallel(
-    to_download: list[dict],
+    to_download: list[DownloadItem],
     prefix: str,
     config: Config,
     tracker: ProgressTracker,
@@ -324,40 +272,113 @@ def _download_parallel(
         show_progress=not config.quiet,
     )
 
-    try:
-        with ThreadPoolExecutor(max_workers=config.workers) as executor:
-            futures = {
-                executor.submit(
-                    download_worker,
+    # Completion records drain through a background thread so the
+    # completion loop never stalls on checkpoint writes; the flusher
+    # coalesces bursts into a single save
+    completions: queue.SimpleQueue[tuple[str, int, str] | None] = queue.SimpleQueue()
+
+    def flush_completions() -> None:
+        while True:
+            record = completions.get()
+            if record is None:
+                return
+            batch = [record]
+            while True:
+                try:
+                    record = completions.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    tracker.mark_complete_many(batch)
+                    return
+                batch.append(record)
+            tracker.mark_complete_many(batch)
+
+    def run_pool(items: list[DownloadItem], max_workers: int) -> None:
+        nonlocal failed
+        # The configured worker count is a cap; the controller sheds
+        # streams that stop paying (throttling, saturated link) and
+        # regrows to the cap when throughput recovers
+        controller = AdaptiveConcurrency(
+            max_workers=max_workers,
+            bytes_completed=lambda: aggregate_progress.completed_bytes,
+        )
+
+        def gated_worker(item: DownloadItem) -> DownloadResult:
+            with controller:
+                return download_worker(
                     client=client,
-                    obj=obj,
+                    item=item,
                     output_dir=config.output_dir,
-                    prefix=prefix,
                     retries=config.retries,
                     skip_verify=config.skip_verify,
                     aggregate_progress=aggregate_progress,
                     credential_manager=cred_manager,
                     bucket=bucket,
-                ): obj
-                for obj in to_download
-            }
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result.success:
-                    tracker.mark_complete(result.key, result.size, result.checksum)
-                    downloaded.append(
-                        {
-                            "path": result.key,
-                            "size": result.size,
-                            "checksum": result.checksum,
-                        }
-                    )
-                else:
-                    logger.error(f"Failed to download {result.key}: {result.error}")
-                    failed += 1
+                )
+
+        def handle(result: DownloadResult) -> None:
+            nonlocal failed
+            if result.success:
+                completions.put((result.key, result.size, result.checksum))
+                downloaded.append(
+                    {
+                        "path": result.key,
+                        "size": result.size,
+                        "checksum": result.checksum,
+                    }
+                )
+            else:
+                logger.error(f"Failed to download {result.key}: {result.error}")
+                failed += 1
+
+        # Sliding submission window: keep at most 2x max_workers futures
+        # alive instead of allocating one per object up front, so memory
+        # stays flat however many files are queued
+        window = max_workers * 2
+        item_iter = iter(items)
+        pending: set[Future[DownloadResult]] = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                while len(pending) < window:
+                    item = next(item_iter, None)
+                    if item is None:
+                        break
+                    pending.add(executor.submit(gated_worker, item))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                controller.maybe_adjust()
+                for future in done:
+                    handle(future.result())
+
+    # Small objects pay mostly per-request overhead, so batch them through
+    # a wider pool to amortize round trips; large objects keep the
+    # configured worker count
+    small = [item for item in to_download if item.size < SMALL_OBJECT_THRESHOLD_BYTES]
+    large = [item for item in to_download if item.size >= SMALL_OBJECT_THRESHOLD_BYTES]
+
+    # One walk creates the whole output tree before the pools start, so
+    # workers never race or repeat makedirs on shared parents
+    prepare_output_tree(to_download, config.output_dir)
+
+    flusher = threading.Thread(target=flush_completions, daemon=True)
+    flusher.start()
+    try:
+        if small:
+            small_workers = config.workers
+            if config.workers > 1:
+                small_workers = min(config.workers * 4, MAX_SMALL_OBJECT_WORKERS)
+            run_pool(small, small_workers)
+        if large:
+            run_pool(large, config.workers)
     finally:
+        completions.put(None)
+        flusher.join()
         aggregate_progress.close()
+        tracker.flush()
 
     return downloaded, failed
 
@@ -481,12 +502,12 @@ def main() -> int:
             )
         return ExitCode.SUCCESS
 
-    total_size = sum(obj["Size"] for obj in to_download)
+    total_size = sum(item.size for item in to_download)
     logger.info(f"Found {len(to_download)} files to download ({total_size / (1024 * 1024):.1f} MB)")
 
     if config.dry_run:
-        for obj in to_download:
-            print(f"Would download: {obj['Key']} ({obj['Size']} bytes)")
+        for item in to_download:
+            print(f"Would download: {item.key} ({item.size} bytes)")
         return ExitCode.SUCCESS
 
     if not config.yes and not config.quiet and sys.stdin.isatty():
@@ -500,14 +521,11 @@ def main() -> int:
 
     start_time = time.time()
     try:
-        if config.workers == 1:
-            downloaded, failed = _download_sequential(
-                to_download, prefix, config, tracker, cred_manager, logger
-            )
-        else:
-            downloaded, failed = _download_parallel(
-                to_download, prefix, config, tracker, cred_manager, client, total_size, logger
-            )
+        # workers=1 is just the degenerate executor case; one code path
+        # keeps progress aggregation and connection reuse identical
+        downloaded, failed = _download_parallel(
+            to_download, prefix, config, tracker, cred_manager, client, total_size, logger
+        )
     except KeyboardInterrupt:
         logger.info("Cancelled by user.")
         return ExitCode.USER_CANCELLED
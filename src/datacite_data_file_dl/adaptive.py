@@ -0,0 +1,106 @@
+"""Adaptive concurrency control for parallel downloads."""
+
+import threading
+import time
+from typing import Callable
+
+# How often the controller re-evaluates the worker limit (seconds)
+SAMPLE_INTERVAL_SECONDS = 2.0
+
+# Relative throughput change treated as noise rather than signal
+THROUGHPUT_TOLERANCE = 0.05
+
+
+class AdaptiveConcurrency:
+    """Gate worker starts behind a limit that tracks observed throughput.
+
+    The configured worker count is an upper bound, not a target: the
+    right number of concurrent streams depends on RTT, per-stream
+    throughput and server-side throttling, none of which are known up
+    front. A hill-climbing step runs at most once per sample interval on
+    the aggregate byte counter:
+
+    - throughput improved: keep stepping in the current direction
+    - throughput got worse: reverse direction
+    - throughput flat: shed one worker (streams that add no throughput
+      only add connections)
+
+    The limit stays within [min_workers, max_workers], so the controller
+    can only back off from the configured count and later regrow to it.
+    Workers hold a permit via ``with controller:`` while downloading.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        bytes_completed: Callable[[], int],
+        min_workers: int = 1,
+        sample_interval: float = SAMPLE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cond = threading.Condition()
+        self._min = min_workers
+        self._max = max_workers
+        self._limit = max_workers
+        self._active = 0
+        self._bytes_completed = bytes_completed
+        self._interval = sample_interval
+        self._clock = clock
+        # Probe downward first: at equal throughput, fewer streams win
+        self._direction = -1
+        self._last_time = clock()
+        self._last_bytes = bytes_completed()
+        self._last_throughput = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current worker limit."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Workers currently holding a permit."""
+        return self._active
+
+    def __enter__(self) -> "AdaptiveConcurrency":
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def maybe_adjust(self) -> None:
+        """Run one hill-climbing step if the sample interval has elapsed.
+
+        Called opportunistically from the completion loop; between
+        intervals it is a cheap time comparison.
+        """
+        now = self._clock()
+        with self._cond:
+            elapsed = now - self._last_time
+            if elapsed < self._interval:
+                return
+
+            total = self._bytes_completed()
+            throughput = (total - self._last_bytes) / elapsed
+
+            if throughput > self._last_throughput * (1 + THROUGHPUT_TOLERANCE):
+                pass  # Improving: keep the current direction
+            elif throughput < self._last_throughput * (1 - THROUGHPUT_TOLERANCE):
+                self._direction = -self._direction
+            else:
+                self._direction = -1
+
+            new_limit = max(self._min, min(self._max, self._limit + self._direction))
+            if new_limit > self._limit:
+                self._cond.notify_all()
+            self._limit = new_limit
+
+            self._last_time = now
+            self._last_bytes = total
+            self._last_throughput = throughput
@@ -6,11 +6,15 @@ from typing import TYPE_CHECKING
 
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 
+from .log import logger
+
 API_URL = "https://api.datacite.org/credentials/datafile"
 
 # Default AWS STS tokens last 1 hour (3600s)
@@ -20,6 +24,13 @@ DEFAULT_CREDENTIAL_LIFETIME_SECONDS = 3600
 # (buffer = 3600 - 1200 = 2400 seconds remaining)
 DEFAULT_REFRESH_INTERVAL_SECONDS = 1200
 
+# botocore's default connection pool size; never shrink below this
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# How long a worker may trust its thread-local client before re-checking
+# credential freshness (seconds)
+FRESHNESS_CHECK_INTERVAL_SECONDS = 30.0
+
 # AWS error codes that indicate credential issues
 CREDENTIAL_ERROR_CODES = frozenset({
     "ExpiredToken",
@@ -32,14 +43,21 @@ CREDENTIAL_ERROR_CODES = frozenset({
 })
 
 
+# Exception types that are credential problems regardless of payload;
+# hoisted so the per-retry check doesn't rebuild the tuple
+_CREDENTIAL_EXC_TYPES = (NoCredentialsError, PartialCredentialsError)
+_EMPTY_ERROR: dict = {}
+
+
 def is_credential_error(exc: BaseException) -> bool:
     """Check if an exception indicates an AWS credential problem."""
-    if isinstance(exc, (NoCredentialsError, PartialCredentialsError)):
+    if isinstance(exc, _CREDENTIAL_EXC_TYPES):
         return True
 
+    # isinstance, not an exact type check: botocore raises generated
+    # ClientError subclasses for modeled service errors
     if isinstance(exc, ClientError):
-        error_code = exc.response.get("Error", {}).get("Code", "")
-        return error_code in CREDENTIAL_ERROR_CODES
+        return exc.response.get("Error", _EMPTY_ERROR).get("Code") in CREDENTIAL_ERROR_CODES
 
     return False
 
@@ -57,26 +75,37 @@ class AWSCredentials:
     access_key_id: str
     secret_access_key: str
     session_token: str
-    fetched_at: float = field(default_factory=time.time)
+    # Monotonic timestamp: wall-clock (time.time) can jump backward under
+    # NTP adjustment, which would mask expiry until requests start failing
+    fetched_at: float = field(default_factory=time.monotonic)
     lifetime_seconds: int = DEFAULT_CREDENTIAL_LIFETIME_SECONDS
 
     def is_expiring_soon(self, buffer_seconds: int | None = None) -> bool:
         """Check if credentials will expire within the buffer period."""
         if buffer_seconds is None:
             buffer_seconds = self.lifetime_seconds - DEFAULT_REFRESH_INTERVAL_SECONDS
-        age = time.time() - self.fetched_at
+        age = time.monotonic() - self.fetched_at
         return age >= (self.lifetime_seconds - buffer_seconds)
 
     def seconds_until_expiry(self) -> float:
         """Return seconds until credentials expire."""
-        age = time.time() - self.fetched_at
+        age = time.monotonic() - self.fetched_at
         return max(0, self.lifetime_seconds - age)
 
 
-def fetch_credentials(username: str, password: str) -> AWSCredentials:
-    """Fetch temporary AWS credentials from DataCite API."""
+def fetch_credentials(
+    username: str,
+    password: str,
+    session: requests.Session | None = None,
+) -> AWSCredentials:
+    """Fetch temporary AWS credentials from DataCite API.
+
+    Pass a session to reuse its connection pool across refreshes;
+    without one each call pays a fresh TCP+TLS handshake.
+    """
+    http = session if session is not None else requests
     try:
-        response = requests.get(
+        response = http.get(
             API_URL,
             auth=(username, password),
             timeout=30,
@@ -120,6 +149,7 @@ class CredentialManager:
         password: str,
         refresh_interval_seconds: int = DEFAULT_REFRESH_INTERVAL_SECONDS,
         credential_lifetime_seconds: int = DEFAULT_CREDENTIAL_LIFETIME_SECONDS,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
     ):
         import threading
 
@@ -127,18 +157,32 @@ class CredentialManager:
         self._password = password
         self._refresh_interval = refresh_interval_seconds
         self._credential_lifetime = credential_lifetime_seconds
+        self._max_pool_connections = max(max_pool_connections, DEFAULT_MAX_POOL_CONNECTIONS)
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
         self._refresh_buffer = credential_lifetime_seconds - refresh_interval_seconds
         self._credentials: AWSCredentials | None = None
         self._client: "S3Client | None" = None
         self._lock = threading.Lock()
         self._refresh_count = 0
+        self._tls = threading.local()
 
     def _create_client(self, creds: AWSCredentials) -> "S3Client":
+        # Pool must be at least as large as the worker count, or threads
+        # queue on connections and botocore logs "Connection pool is full"
         return boto3.client(
             "s3",
             aws_access_key_id=creds.access_key_id,
             aws_secret_access_key=creds.secret_access_key,
             aws_session_token=creds.session_token,
+            config=BotoConfig(
+                max_pool_connections=self._max_pool_connections,
+                tcp_keepalive=True,
+                # Backoff lives in retry.py; botocore's own retry loop
+                # would multiply against it (each of our attempts hiding
+                # several of botocore's, with uncoordinated sleeps)
+                retries={"max_attempts": 1, "mode": "standard"},
+            ),
         )
 
     def _needs_refresh(self) -> bool:
@@ -147,11 +191,7 @@ class CredentialManager:
         return self._credentials.is_expiring_soon(self._refresh_buffer)
 
     def _refresh_credentials(self) -> None:
-        from .log import get_logger
-
-        logger = get_logger()
-
-        self._credentials = fetch_credentials(self._username, self._password)
+        self._credentials = fetch_credentials(self._username, self._password, session=self._http)
         self._client = self._create_client(self._credentials)
         self._refresh_count += 1
 
@@ -163,8 +203,24 @@ class CredentialManager:
         )
 
     def get_client(self) -> "S3Client":
-        """Get an S3 client, refreshing credentials if needed. Thread-safe."""
+        """Get an S3 client, refreshing credentials if needed. Thread-safe.
+
+        Workers call this before every attempt, so the steady state is a
+        thread-local read guarded by one epoch compare; expiry math only
+        reruns every FRESHNESS_CHECK_INTERVAL_SECONDS per thread.
+        """
+        tls = self._tls
+        now = time.monotonic()
+        if (
+            getattr(tls, "epoch", -1) == self._refresh_count
+            and now - tls.checked_at < FRESHNESS_CHECK_INTERVAL_SECONDS
+        ):
+            return tls.client  # type: ignore[no-any-return]
+
         if not self._needs_refresh() and self._client is not None:
+            tls.client = self._client
+            tls.epoch = self._refresh_count
+            tls.checked_at = now
             return self._client
 
         # Slow path: acquire lock and refresh
@@ -172,6 +228,9 @@ class CredentialManager:
             # Double-check after acquiring lock
             if self._needs_refresh() or self._client is None:
                 self._refresh_credentials()
+            tls.client = self._client
+            tls.epoch = self._refresh_count
+            tls.checked_at = now
             return self._client  # type: ignore[return-value]
 
     def ensure_fresh(self) -> None:
@@ -183,9 +242,6 @@ class CredentialManager:
 
     def force_refresh(self) -> "S3Client":
         """Force an immediate credential refresh. Thread-safe."""
-        from .log import get_logger
-
-        logger = get_logger()
         logger.info("Forcing credential refresh due to authentication error...")
 
         with self._lock:
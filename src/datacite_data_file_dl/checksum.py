@@ -1,9 +1,27 @@
 """Checksum computation and verification."""
 
 import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .log import get_logger
+from .log import logger
+
+# Optional SIMD-accelerated hashing (install with the 'blake3' extra)
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None  # type: ignore[assignment]
+
+
+# Part sizes commonly used by S3 multipart uploads (aws cli, boto3 defaults)
+S3_PART_SIZES = (
+    8 * 1024 * 1024,
+    16 * 1024 * 1024,
+    64 * 1024 * 1024,
+    128 * 1024 * 1024,
+)
 
 
 class ChecksumMismatch(Exception):
@@ -16,7 +34,7 @@ class ChecksumMismatch(Exception):
         super().__init__(f"Checksum mismatch for {path}: expected {expected}, got {actual}")
 
 
-def compute_md5(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
+def compute_md5(path: str | Path, chunk_size: int = 8 * 1024 * 1024) -> str:
     """Compute MD5 hash of a file.
 
     Args:
@@ -26,16 +44,68 @@ def compute_md5(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
     Returns:
         Hex-encoded MD5 hash
     """
-    md5 = hashlib.md5()
-
     with open(path, "rb") as f:
+        # hashlib.file_digest (3.11+) hashes in C and releases the GIL,
+        # so parallel workers can keep downloading during verification
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "md5").hexdigest()
+
+        md5 = hashlib.md5()
         while chunk := f.read(chunk_size):
             md5.update(chunk)
+        return md5.hexdigest()
+
+
+def compute_blake3(path: Path) -> str | None:
+    """Compute a BLAKE3 hash of a file, or None if blake3 is not installed.
+
+    BLAKE3 runs several GB/s via SIMD and multithreading, so it is cheap
+    enough to use as a local integrity check where the S3 ETag cannot be
+    verified (e.g. non-default multipart uploads).
+    """
+    if _blake3 is None:
+        return None
+
+    hasher = _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+    hasher.update_mmap(str(path))
+    return hasher.hexdigest()
+
+
+def _infer_part_size(file_size: int, part_count: int) -> int | None:
+    """Find the S3 part size that splits file_size into part_count parts.
 
-    return md5.hexdigest()
+    Returns None if no common part size matches (e.g. a non-default
+    multipart configuration was used for the upload).
+    """
+    for part_size in S3_PART_SIZES:
+        if -(-file_size // part_size) == part_count:  # ceil division
+            return part_size
+    return None
+
+
+def compute_multipart_etag(path: Path, part_size: int, part_count: int) -> str:
+    """Compute an S3 multipart ETag (MD5 of concatenated per-part MD5s).
+
+    Parts are hashed in parallel; hashlib releases the GIL for large
+    buffers, so this scales with core count on multi-GB files.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+
+        def hash_part(index: int) -> bytes:
+            return hashlib.md5(os.pread(fd, part_size, index * part_size)).digest()
 
+        max_workers = min(part_count, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = list(executor.map(hash_part, range(part_count)))
+    finally:
+        os.close(fd)
 
-def verify_checksum(path: Path, expected_etag: str) -> None:
+    combined = hashlib.md5(b"".join(digests)).hexdigest()
+    return f"{combined}-{part_count}"
+
+
+def verify_checksum(path: str | Path, expected_etag: str) -> None:
     """Verify file checksum against S3 ETag.
 
     Args:
@@ -46,21 +116,33 @@ def verify_checksum(path: Path, expected_etag: str) -> None:
         ChecksumMismatch: If checksum doesn't match
 
     Note:
-        Multipart upload ETags (containing '-') cannot be verified as they
-        use a different algorithm. These are silently skipped.
+        Multipart upload ETags (containing '-') are verified by reproducing
+        the per-part MD5 algorithm when the part size can be inferred from
+        common S3 defaults; otherwise they are silently skipped.
     """
-    logger = get_logger()
-
     # Strip surrounding quotes from ETag
     expected = expected_etag.strip('"')
 
     # Multipart uploads have ETags like "hash-partcount"
-    # These can't be verified with simple MD5
     if "-" in expected:
-        logger.debug(f"Skipping checksum for multipart upload: {path}")
+        try:
+            part_count = int(expected.rsplit("-", 1)[1])
+        except ValueError:
+            part_count = 0
+
+        part_size = _infer_part_size(os.path.getsize(path), part_count) if part_count else None
+        if part_size is None:
+            logger.debug(f"Skipping checksum for multipart upload: {path}")
+            return
+
+        actual = compute_multipart_etag(Path(path), part_size, part_count)
+        if actual != expected:
+            raise ChecksumMismatch(Path(path), expected, actual)
+
+        logger.debug(f"Multipart checksum verified: {path}")
         return
 
-    actual = compute_md5(Path(path))
+    actual = compute_md5(path)
 
     if actual != expected:
         raise ChecksumMismatch(Path(path), expected, actual)
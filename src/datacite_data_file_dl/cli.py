@@ -2,11 +2,19 @@
 
 import argparse
 import os
+from functools import lru_cache
 
 from . import __version__
 
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    return _build_parser().parse_args(args)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; the ~30 add_argument calls are
+    pure construction and the result is reusable."""
     parser = argparse.ArgumentParser(
         prog="datacite-data-file-dl",
         description="Download DataCite monthly data files from S3",
@@ -199,4 +207,4 @@ Config file: ~/.datacite-data-file-dl.toml or ~/.config/datacite-data-file-dl/co
         version=f"%(prog)s {__version__}",
     )
 
-    return parser.parse_args(args)
+    return parser
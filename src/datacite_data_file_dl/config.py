@@ -1,7 +1,10 @@
 """Configuration loading from CLI args, environment, and config file."""
 
+import copy
 import os
 import sys
+import threading
+import time
 import warnings
 from dataclasses import dataclass
 from getpass import getpass
@@ -79,16 +82,54 @@ class Config:
     bucket: str | None = None
 
 
+# Parsed-TOML cache keyed by resolved path. Entries store (st_mtime_ns,
+# st_size, parsed dict) so an edited file invalidates itself; repeat
+# loads within one process (interactive session, credential refresh)
+# cost a single stat() instead of re-tokenizing the file.
+_toml_cache: dict[str, tuple[int, int, dict[str, object]]] = {}
+_toml_cache_lock = threading.Lock()
+
+# Negative-stat cache for the default config locations: once a default
+# path is known to be absent, skip re-statting it for a while. Explicit
+# --config paths are never cached negatively, so a file created between
+# calls is still picked up immediately.
+_MISSING_PATH_TTL_SECONDS = 60.0
+_missing_paths: dict[str, float] = {}
+
+
+def _read_toml(config_path: Path) -> dict[str, object]:
+    st = os.stat(config_path)
+    key = str(config_path)
+    with _toml_cache_lock:
+        cached = _toml_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            # Deep copy so callers can't mutate the cached parse
+            return copy.deepcopy(cached[2])
+
+    with open(config_path, "rb") as f:
+        parsed = dict(tomllib.load(f))
+
+    with _toml_cache_lock:
+        _toml_cache[key] = (st.st_mtime_ns, st.st_size, parsed)
+    return copy.deepcopy(parsed)
+
+
 def _load_config_file(path: str | Path | None) -> dict[str, object]:
     if path is not None:
-        paths = [Path(path)]
-    else:
-        paths = DEFAULT_CONFIG_PATHS
-
-    for config_path in paths:
-        if config_path.exists():
-            with open(config_path, "rb") as f:
-                return dict(tomllib.load(f))
+        try:
+            return _read_toml(Path(path))
+        except FileNotFoundError:
+            return {}
+
+    for config_path in DEFAULT_CONFIG_PATHS:
+        key = str(config_path)
+        checked_at = _missing_paths.get(key)
+        if checked_at is not None and time.monotonic() - checked_at < _MISSING_PATH_TTL_SECONDS:
+            continue
+        try:
+            return _read_toml(config_path)
+        except FileNotFoundError:
+            _missing_paths[key] = time.monotonic()
 
     return {}
 
@@ -102,21 +143,30 @@ def load_config(
     **kwargs: object,
 ) -> Config:
     """Precedence: CLI > env > config file > prompt."""
-    file_config = _load_config_file(config_file)
+    # The config file is only opened and parsed if some field is still
+    # unresolved after CLI and env; fully CLI/env-driven invocations
+    # (the common CI path) never touch the filesystem
+    _file_cache: dict[str, object] | None = None
+
+    def file_config() -> dict[str, object]:
+        nonlocal _file_cache
+        if _file_cache is None:
+            _file_cache = _load_config_file(config_file)
+        return _file_cache
 
     # Resolve username: CLI > env > file
     username = cli_username
     if username is None:
         username = os.environ.get(ENV_USERNAME)
     if username is None:
-        username = cast(str | None, file_config.get("username"))
+        username = cast(str | None, file_config().get("username"))
 
     # Resolve password: CLI > env > file (though file storage discouraged)
     password = cli_password
     if password is None:
         password = os.environ.get(ENV_PASSWORD)
     if password is None:
-        password = cast(str | None, file_config.get("password"))
+        password = cast(str | None, file_config().get("password"))
         if password is not None:
             warnings.warn(
                 "Password loaded from config file. Storing passwords in plaintext "
@@ -132,7 +182,7 @@ def load_config(
     # Resolve output directory: CLI > file > cwd
     output_dir = cli_output_dir
     if output_dir is None:
-        output_dir = cast(str | None, file_config.get("output_dir"))
+        output_dir = cast(str | None, file_config().get("output_dir"))
     if output_dir is None:
         output_dir = os.getcwd()
 
@@ -148,7 +198,7 @@ def load_config(
             except ValueError:
                 pass  # Ignore invalid env var, use file/default
     if refresh_interval is None:
-        refresh_interval = cast(int | None, file_config.get("refresh_interval"))
+        refresh_interval = cast(int | None, file_config().get("refresh_interval"))
     if refresh_interval is None:
         refresh_interval = DEFAULT_REFRESH_INTERVAL_MINUTES
 
@@ -1,15 +1,25 @@
 """S3 download operations."""
 
 import fnmatch
+import hashlib
+import heapq
 import json
+import logging
 import os
 import re
+import sys
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 from tqdm import tqdm
 
 if TYPE_CHECKING:
@@ -17,10 +27,10 @@ if TYPE_CHECKING:
 
 from .auth import AWSCredentials, CredentialManager
 from .checksum import verify_checksum, ChecksumMismatch
-from .log import get_logger
+from .log import logger
 from .progress import AggregateProgress, ProgressTracker
 from .retry import retry_with_backoff, retry_with_credential_refresh, RetryExhausted
-from .safe_path import PathTraversalError, safe_join
+from .safe_path import PathTraversalError, safe_join_str
 
 
 DEFAULT_BUCKET = "monthly-datafile.datacite.org"
@@ -28,6 +38,78 @@ BUCKET = DEFAULT_BUCKET  # Backwards compatibility alias
 
 LARGE_DOWNLOAD_THRESHOLD_BYTES = 100 * 1024 * 1024  # 100 MB
 
+# Objects below this size are dominated by per-request overhead (round
+# trips, request parsing) rather than transfer time, so they benefit from
+# much higher concurrency than large objects
+SMALL_OBJECT_THRESHOLD_BYTES = 256 * 1024
+MAX_SMALL_OBJECT_WORKERS = 32
+
+# Shared s3transfer config: large objects download as parallel ranged GETs,
+# so even a single big file uses multiple connections
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+# Directories already created this run; exist_ok=True still stats every
+# path component, so skipping on a set hit saves thousands of syscalls
+# when many files land in a handful of directories
+_ensured_dirs: set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _effective_progress(flag: bool) -> bool:
+    """Decide whether a tqdm bar is worth drawing.
+
+    With stderr redirected (CI, cron, piped logs) tqdm still writes and
+    flushes escape sequences per update; suppress the bar there and when
+    CI or NO_PROGRESS is set explicitly.
+    """
+    if not flag:
+        return False
+    if "CI" in os.environ or "NO_PROGRESS" in os.environ:
+        return False
+    return sys.stderr.isatty()
+
+
+def _ensure_dir(directory: str) -> None:
+    if directory in _ensured_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(directory)
+
+
+# Flush batched progress to the bar/aggregate roughly once per MiB;
+# s3transfer fires its callback per ~8 KB chunk, and forwarding every
+# one acquires tqdm's lock ~128x more often than needed
+PROGRESS_FLUSH_BYTES = 1024 * 1024
+
+
+class _BatchedProgress:
+    """Accumulate transferred bytes and forward them in ~1 MiB batches."""
+
+    __slots__ = ("_sink", "_acc")
+
+    def __init__(self, sink: Callable[[int], None]) -> None:
+        self._sink = sink
+        self._acc = 0
+
+    def __call__(self, bytes_transferred: int) -> None:
+        self._acc += bytes_transferred
+        if self._acc >= PROGRESS_FLUSH_BYTES:
+            self._sink(self._acc)
+            self._acc = 0
+
+    def flush(self) -> None:
+        """Forward any remainder below the batch threshold."""
+        if self._acc:
+            self._sink(self._acc)
+            self._acc = 0
+
 
 @dataclass
 class DownloadResult:
@@ -40,45 +122,135 @@ class DownloadResult:
     error: str | None = None
 
 
-def create_s3_client(creds: AWSCredentials) -> "S3Client":
-    """Create boto3 S3 client with temporary credentials."""
+@dataclass(slots=True)
+class DownloadItem:
+    """Precomputed work unit for a single download.
+
+    The relative path and quote-stripped ETag are derived once at list
+    time so workers (and their retry loops) skip re-parsing per attempt.
+    """
+
+    key: str
+    size: int
+    etag: str
+    relative_path: str
+
+
+def make_download_item(obj: dict, prefix: str) -> DownloadItem:
+    """Build a DownloadItem from a raw S3 object dict."""
+    key = obj["Key"]
+    relative_path = key[len(prefix) :].lstrip("/") if prefix else key
+    if not relative_path:
+        relative_path = key.split("/")[-1]
+    return DownloadItem(
+        key=key,
+        size=obj["Size"],
+        etag=obj["ETag"].strip('"'),
+        relative_path=relative_path,
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_s3_client(
+    access_key_id: str, secret_access_key: str, session_token: str
+) -> "S3Client":
     return boto3.client(
         "s3",
-        aws_access_key_id=creds.access_key_id,
-        aws_secret_access_key=creds.secret_access_key,
-        aws_session_token=creds.session_token,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+    )
+
+
+def create_s3_client(creds: AWSCredentials) -> "S3Client":
+    """Create boto3 S3 client with temporary credentials.
+
+    Construction loads botocore's service model and resolves endpoints
+    (tens of ms), so clients are cached per credential set; repeat calls
+    with unexpired credentials reuse the same client and its connection
+    pool.
+    """
+    return _cached_s3_client(
+        creds.access_key_id, creds.secret_access_key, creds.session_token
     )
 
 
+# Interactive browsing hits the same prefixes repeatedly (going back up
+# a level, previewing a filter) and each listing is a network round trip
+# of tens of ms. Entries are keyed per client object via a weak mapping
+# so caches die with their client and a recycled id can't serve stale
+# results. lru_cache has no TTL, hence the manual timestamps.
+LIST_CACHE_TTL_SECONDS = 60.0
+
+_list_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_list_cache_lock = threading.Lock()
+
+
+def clear_list_cache() -> None:
+    """Drop all cached prefix listings (e.g. after bucket contents change)."""
+    with _list_cache_lock:
+        _list_cache.clear()
+
+
 def list_contents(
     client: "S3Client", prefix: str = "", bucket: str = BUCKET
 ) -> tuple[list[str], list[str]]:
     """List folders and files at a given prefix.
 
+    Uses Delimiter='/' so S3 collapses sub-folders into CommonPrefixes
+    server-side; cost scales with distinct prefixes at this level, not
+    with every object underneath them. Results are cached per client for
+    LIST_CACHE_TTL_SECONDS.
+
     Returns:
         Tuple of (folder_names, file_names) at this level
     """
-    folders: list[str] = []
-    files: list[str] = []
+    now = time.monotonic()
+    with _list_cache_lock:
+        entry = _list_cache.get(client, {}).get((bucket, prefix))
+        if entry is not None:
+            fetched_at, folders, files = entry
+            if now - fetched_at < LIST_CACHE_TTL_SECONDS:
+                # Copies, so callers mutating the result can't poison the cache
+                return list(folders), list(files)
+
+    folders, files = _list_contents_uncached(client, prefix, bucket)
+
+    with _list_cache_lock:
+        _list_cache.setdefault(client, {})[(bucket, prefix)] = (
+            now,
+            tuple(folders),
+            tuple(files),
+        )
+    return folders, files
+
+
+def _list_contents_uncached(
+    client: "S3Client", prefix: str, bucket: str
+) -> tuple[list[str], list[str]]:
+    # Each page arrives already sorted from S3, so a k-way merge of the
+    # per-page lists is O(n log k) instead of re-sorting everything
+    folder_pages: list[list[str]] = []
+    file_pages: list[list[str]] = []
 
     paginator = client.get_paginator("list_objects_v2")
     pages = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/")
 
+    plen = len(prefix)
     for page in pages:
-        for cp in page.get("CommonPrefixes", []):
-            folder = cp["Prefix"]
-            name = folder[len(prefix) :].rstrip("/")
-            folders.append(name)
+        folders = [
+            cp["Prefix"][plen:].rstrip("/") for cp in page.get("CommonPrefixes") or ()
+        ]
+        # An empty slice means key == prefix (the placeholder object for
+        # the folder itself), which is skipped along with empty names
+        files = [name for obj in page.get("Contents") or () if (name := obj["Key"][plen:])]
 
-        for obj in page.get("Contents", []):
-            key = obj["Key"]
-            if key == prefix:
-                continue
-            name = key[len(prefix) :]
-            if name:  # Skip empty names
-                files.append(name)
+        if folders:
+            folder_pages.append(folders)
+        if files:
+            file_pages.append(files)
 
-    return sorted(folders), sorted(files)
+    return list(heapq.merge(*folder_pages)), list(heapq.merge(*file_pages))
 
 
 def get_object_size(client: "S3Client", key: str, bucket: str = BUCKET) -> int:
@@ -114,12 +286,18 @@ def download_file(
     local_path: str,
     show_progress: bool = True,
     bucket: str = BUCKET,
+    size: int | None = None,
 ) -> None:
-    """Download a single file with progress bar."""
-    os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
+    """Download a single file with progress bar.
+
+    Pass size when it is already known from a listing to skip the
+    HeadObject round-trip that otherwise sizes the progress bar.
+    """
+    _ensure_dir(os.path.dirname(local_path) or ".")
 
-    if show_progress:
-        size = get_object_size(client, s3_key, bucket=bucket)
+    if _effective_progress(show_progress):
+        if size is None:
+            size = get_object_size(client, s3_key, bucket=bucket)
         filename = os.path.basename(s3_key)
 
         with tqdm(
@@ -129,13 +307,13 @@ def download_file(
             desc=filename,
             ncols=80,
         ) as pbar:
-
-            def callback(bytes_transferred: int) -> None:
-                pbar.update(bytes_transferred)
-
-            client.download_file(bucket, s3_key, local_path, Callback=callback)
+            callback = _BatchedProgress(pbar.update)
+            client.download_file(
+                bucket, s3_key, local_path, Callback=callback, Config=TRANSFER_CONFIG
+            )
+            callback.flush()
     else:
-        client.download_file(bucket, s3_key, local_path)
+        client.download_file(bucket, s3_key, local_path, Config=TRANSFER_CONFIG)
 
 
 def download_prefix(
@@ -153,12 +331,12 @@ def download_prefix(
     paginator = client.get_paginator("list_objects_v2")
     pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
 
-    keys: list[str] = []
+    keys: list[tuple[str, int]] = []
     total_size = 0
 
     for page in pages:
-        for obj in page.get("Contents", []):
-            keys.append(obj["Key"])
+        for obj in page.get("Contents") or ():
+            keys.append((obj["Key"], obj["Size"]))
             total_size += obj["Size"]
 
     if not keys:
@@ -167,22 +345,43 @@ def download_prefix(
 
     print(f"Downloading {len(keys)} files ({total_size / (1024 * 1024):.1f} MB)")
 
-    logger = get_logger()
-    for key in tqdm(keys, desc="Files", disable=not show_progress):
+    for key, size in tqdm(keys, desc="Files", disable=not show_progress):
         relative_path = key[len(prefix) :].lstrip("/")
         if not relative_path:
             relative_path = os.path.basename(key)
         try:
-            local_path = safe_join(output_dir, relative_path)
+            local_path = safe_join_str(output_dir, relative_path)
         except PathTraversalError as e:
             logger.warning(f"Skipping unsafe path for {key}: {e}")
             continue
 
-        download_file(client, key, str(local_path), show_progress=False, bucket=bucket)
+        download_file(
+            client, key, local_path, show_progress=False, bucket=bucket, size=size
+        )
 
     return len(keys)
 
 
+def iter_all_objects(
+    client: "S3Client",
+    prefix: str = "",
+    bucket: str = BUCKET,
+) -> Iterator[dict]:
+    """Iterate all objects under a prefix recursively.
+
+    Yields the raw object dicts one page at a time, so callers can
+    filter and start downloading while listing is still in flight
+    instead of buffering the entire bucket listing. Callers that loop
+    over objects should convert each dict to a DownloadItem once and
+    use attribute access from there.
+    """
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+
+    for page in pages:
+        yield from page.get("Contents") or ()
+
+
 def list_all_objects(
     client: "S3Client",
     prefix: str = "",
@@ -193,42 +392,123 @@ def list_all_objects(
     Returns:
         List of object dicts with Key, Size, and ETag
     """
-    paginator = client.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+    return list(iter_all_objects(client, prefix, bucket=bucket))
 
-    objects: list[dict] = []
-    for page in pages:
-        for obj in page.get("Contents", []):
-            objects.append(
-                {
-                    "Key": obj["Key"],
-                    "Size": obj["Size"],
-                    "ETag": obj["ETag"],
-                }
-            )
 
-    return objects
+_SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB|B)?$")
+
+_SIZE_MULTIPLIERS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+    "TB": 1024 * 1024 * 1024 * 1024,
+}
 
 
+@lru_cache(maxsize=4096)
 def parse_size(size_str: str) -> int:
     """Parse human-readable size string (e.g., "10MB", "1GB") to bytes."""
     size_str = size_str.strip().upper()
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB|B)?$", size_str)
+    match = _SIZE_RE.match(size_str)
     if not match:
         raise ValueError(f"Invalid size format: {size_str}")
 
     value = float(match.group(1))
     unit = match.group(2) or "B"
 
-    multipliers = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024 * 1024,
-        "GB": 1024 * 1024 * 1024,
-        "TB": 1024 * 1024 * 1024 * 1024,
-    }
+    return int(value * _SIZE_MULTIPLIERS[unit])
+
+
+@lru_cache(maxsize=None)
+def _compile_globs(patterns: tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a set of glob patterns into one alternation regex.
+
+    A single compiled pattern replaces a Python-level any() loop over
+    per-pattern fnmatch calls, so matching cost stops scaling with the
+    number of patterns per object.
+    """
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def prepare_output_tree(items: "Iterable[DownloadItem]", output_dir: str | Path) -> None:
+    """Create every output directory for a batch of items up front.
+
+    One walk over the unique parent set replaces N per-file makedirs
+    calls; the directories are seeded into the _ensured_dirs cache, so
+    workers hit it and skip the syscall entirely. Items with unsafe
+    paths are left for their worker to reject with a proper error.
+    """
+    parents: set[str] = set()
+    for item in items:
+        try:
+            parents.add(os.path.dirname(safe_join_str(output_dir, item.relative_path)))
+        except PathTraversalError:
+            continue
+    for directory in sorted(parents):
+        _ensure_dir(directory)
 
-    return int(value * multipliers[unit])
+
+def filter_objects(
+    objects: "Iterable[dict]",
+    prefix: str,
+    tracker: ProgressTracker,
+    include_patterns: list[str] | None = None,
+    exclude_patterns: list[str] | None = None,
+    max_size: int | None = None,
+) -> tuple[list[DownloadItem], int]:
+    """Filter a listing stream into download items in one pass.
+
+    Equivalent to calling should_download_file per object, but with the
+    per-call overhead hoisted out of the loop: the glob regexes compile
+    and bind once, completion checks go straight to the tracker's
+    lock-free set, and skip messages only format when debug logging is
+    actually enabled. Returns (items_to_download, skipped_count).
+    """
+    include_match = (
+        _compile_globs(tuple(include_patterns)).match if include_patterns else None
+    )
+    exclude_match = (
+        _compile_globs(tuple(exclude_patterns)).match if exclude_patterns else None
+    )
+    is_complete = tracker.is_complete
+    debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else None
+
+    items: list[DownloadItem] = []
+    skipped = 0
+    for obj in objects:
+        item = make_download_item(obj, prefix)
+        key = item.key
+
+        if is_complete(key):
+            skipped += 1
+            if debug:
+                debug(f"Skipping completed file: {key}")
+            continue
+
+        filename = key[key.rfind("/") + 1 :]
+
+        if include_match is not None and not include_match(filename):
+            skipped += 1
+            if debug:
+                debug(f"Skipping {key}: doesn't match include patterns")
+            continue
+
+        if exclude_match is not None and exclude_match(filename):
+            skipped += 1
+            if debug:
+                debug(f"Skipping {key}: matches exclude pattern")
+            continue
+
+        if max_size is not None and item.size > max_size:
+            skipped += 1
+            if debug:
+                debug(f"Skipping {key}: size {item.size} exceeds max {max_size}")
+            continue
+
+        items.append(item)
+
+    return items, skipped
 
 
 def should_download_file(
@@ -239,8 +519,11 @@ def should_download_file(
     exclude_patterns: list[str] | None = None,
     max_size: int | None = None,
 ) -> bool:
-    """Determine if a file should be downloaded based on filters and completion status."""
-    logger = get_logger()
+    """Determine if a file should be downloaded based on filters and completion status.
+
+    Called once per listed object, so it must stay cheap: completion is a
+    dict lookup in the tracker and never a per-object filesystem stat.
+    """
 
     if tracker.is_complete(key):
         logger.debug(f"Skipping completed file: {key}")
@@ -249,14 +532,12 @@ def should_download_file(
     filename = os.path.basename(key)
 
     if include_patterns:
-        matches_include = any(fnmatch.fnmatch(filename, pattern) for pattern in include_patterns)
-        if not matches_include:
+        if not _compile_globs(tuple(include_patterns)).match(filename):
             logger.debug(f"Skipping {key}: doesn't match include patterns")
             return False
 
     if exclude_patterns:
-        matches_exclude = any(fnmatch.fnmatch(filename, pattern) for pattern in exclude_patterns)
-        if matches_exclude:
+        if _compile_globs(tuple(exclude_patterns)).match(filename):
             logger.debug(f"Skipping {key}: matches exclude pattern")
             return False
 
@@ -277,6 +558,7 @@ def download_file_with_retry(
     progress: bool | Callable[[int], None] = True,
     credential_manager: CredentialManager | None = None,
     bucket: str = BUCKET,
+    size: int | None = None,
 ) -> None:
     """Download a file with retry logic and checksum verification.
 
@@ -285,34 +567,136 @@ def download_file_with_retry(
 
     Args:
         progress: True for tqdm bar, False for none, or a callback for parallel downloads
+        size: Object size if known from a listing; avoids a HeadObject call
     """
-    logger = get_logger()
-    local_path = Path(local_path)
-    local_path.parent.mkdir(parents=True, exist_ok=True)
+    # Everything below works on plain strings: per-file Path construction
+    # is ~2µs each and this function runs once per downloaded object
+    local_path = os.fspath(local_path)
+    _ensure_dir(os.path.dirname(local_path))
+
+    if progress is True:
+        progress = _effective_progress(True)
+
+    temp_path = local_path + ".tmp"
+
+    def _discard_temp() -> None:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+    def _try_resume(active_client: "S3Client", offset: int) -> bool:
+        """Append the missing byte range to a leftover temp file.
+
+        Guards with If-Match on the expected ETag; returns False (after
+        discarding the stale temp file) when the remote object changed
+        or the range is unsatisfiable, so the caller restarts from zero.
+        """
+        # _download only attempts a resume when expected_etag is set
+        assert expected_etag is not None
+        try:
+            response = active_client.get_object(
+                Bucket=bucket,
+                Key=s3_key,
+                Range=f"bytes={offset}-",
+                IfMatch=expected_etag,
+            )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code in ("PreconditionFailed", "InvalidRange", "412", "416"):
+                os.remove(temp_path)
+                return False
+            raise
+
+        callback = progress if callable(progress) else None
+        pbar = None
+        if progress is True:
+            pbar = tqdm(
+                total=offset + response["ContentLength"],
+                initial=offset,
+                unit="B",
+                unit_scale=True,
+                desc=os.path.basename(s3_key),
+                ncols=80,
+            )
+        try:
+            with open(temp_path, "ab") as f:
+                for chunk in response["Body"].iter_chunks(1024 * 1024):
+                    f.write(chunk)
+                    if callback is not None:
+                        callback(len(chunk))
+                    if pbar is not None:
+                        pbar.update(len(chunk))
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+        logger.debug(f"Resumed {s3_key} from byte {offset}")
+        return True
+
+    # Single-part objects can hash while they stream: the ETag is a plain
+    # MD5, so folding the digest into the write loop verifies the file
+    # without the post-download re-read that verify_checksum would do
+    verified_inline = False
+    stream_inline = (
+        expected_etag is not None
+        and "-" not in expected_etag.strip('"')
+        and size is not None
+        and size < TRANSFER_CONFIG.multipart_threshold
+        and progress is not True  # The tqdm path stays on download_file
+    )
 
-    temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+    def _stream_and_hash(active_client: "S3Client") -> None:
+        nonlocal verified_inline
+        response = active_client.get_object(Bucket=bucket, Key=s3_key)
+        callback = progress if callable(progress) else None
+        md5 = hashlib.md5()
+        with open(temp_path, "wb") as f:
+            for chunk in response["Body"].iter_chunks(1024 * 1024):
+                f.write(chunk)
+                md5.update(chunk)
+                if callback is not None:
+                    callback(len(chunk))
+
+        if not skip_verify:
+            expected = expected_etag.strip('"')  # type: ignore[union-attr]
+            actual = md5.hexdigest()
+            if actual != expected:
+                raise ChecksumMismatch(Path(temp_path), expected, actual)
+        verified_inline = True
 
     def _download(active_client: "S3Client") -> None:
+        if expected_etag and os.path.exists(temp_path):
+            offset = os.path.getsize(temp_path)
+            if offset > 0 and _try_resume(active_client, offset):
+                return
+
+        if stream_inline:
+            _stream_and_hash(active_client)
+            return
+
         if progress is True:
-            size = get_object_size(active_client, s3_key, bucket=bucket)
+            total = size if size is not None else get_object_size(active_client, s3_key, bucket=bucket)
             filename = os.path.basename(s3_key)
 
             with tqdm(
-                total=size,
+                total=total,
                 unit="B",
                 unit_scale=True,
                 desc=filename,
                 ncols=80,
             ) as pbar:
-
-                def callback(bytes_transferred: int) -> None:
-                    pbar.update(bytes_transferred)
-
-                active_client.download_file(bucket, s3_key, str(temp_path), Callback=callback)
+                callback = _BatchedProgress(pbar.update)
+                active_client.download_file(
+                    bucket, s3_key, temp_path, Callback=callback, Config=TRANSFER_CONFIG
+                )
+                callback.flush()
         elif callable(progress):
-            active_client.download_file(bucket, s3_key, str(temp_path), Callback=progress)
+            active_client.download_file(
+                bucket, s3_key, temp_path, Callback=progress, Config=TRANSFER_CONFIG
+            )
         else:
-            active_client.download_file(bucket, s3_key, str(temp_path))
+            active_client.download_file(bucket, s3_key, temp_path, Config=TRANSFER_CONFIG)
 
     try:
         if credential_manager is not None:
@@ -329,27 +713,35 @@ def download_file_with_retry(
 
             _download_with_client()
 
-        if not skip_verify and expected_etag:
+        if not skip_verify and expected_etag and not verified_inline:
             verify_checksum(temp_path, expected_etag)
 
-        temp_path.rename(local_path)
+        os.replace(temp_path, local_path)
+
+        # The file has been written and (optionally) re-read for
+        # verification; drop its pages so bulk downloads don't evict
+        # genuinely hot data from the page cache
+        if hasattr(os, "posix_fadvise"):
+            fd = os.open(local_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
         logger.debug(f"Downloaded: {s3_key} -> {local_path}")
 
     except (RetryExhausted, ChecksumMismatch):
-        if temp_path.exists():
-            temp_path.unlink()
+        _discard_temp()
         raise
     except Exception:
-        if temp_path.exists():
-            temp_path.unlink()
+        _discard_temp()
         raise
 
 
 def download_worker(
     client: "S3Client",
-    obj: dict,
+    item: DownloadItem,
     output_dir: str,
-    prefix: str,
     retries: int,
     skip_verify: bool,
     aggregate_progress: AggregateProgress | None,
@@ -357,30 +749,27 @@ def download_worker(
     bucket: str = BUCKET,
 ) -> DownloadResult:
     """Download a single file for use with ThreadPoolExecutor."""
-    key = obj["Key"]
-    size = obj["Size"]
-    etag = obj["ETag"]
+    key = item.key
+    size = item.size
+    etag = item.etag
 
     if credential_manager is not None:
         client = credential_manager.get_client()
 
-    relative_path = key[len(prefix) :].lstrip("/") if prefix else key
-    if not relative_path:
-        relative_path = key.split("/")[-1]
     try:
-        local_path = safe_join(output_dir, relative_path)
+        local_path = safe_join_str(output_dir, item.relative_path)
     except PathTraversalError as e:
         return DownloadResult(
             key=key,
             size=size,
-            checksum=etag.strip('"'),
+            checksum=etag,
             success=False,
             error=f"Unsafe path: {e}",
         )
 
-    def progress_callback(bytes_transferred: int) -> None:
-        if aggregate_progress is not None:
-            aggregate_progress.update(bytes_transferred)
+    progress_callback: _BatchedProgress | None = None
+    if aggregate_progress is not None:
+        progress_callback = _BatchedProgress(aggregate_progress.update)
 
     try:
         download_file_with_retry(
@@ -390,29 +779,34 @@ def download_worker(
             expected_etag=etag,
             retries=retries,
             skip_verify=skip_verify,
-            progress=progress_callback if aggregate_progress else False,
+            progress=progress_callback if progress_callback is not None else False,
             credential_manager=credential_manager,
             bucket=bucket,
+            size=size,
         )
 
         if aggregate_progress is not None:
+            assert progress_callback is not None
+            progress_callback.flush()
             aggregate_progress.complete_file()
 
         return DownloadResult(
             key=key,
             size=size,
-            checksum=etag.strip('"'),
+            checksum=etag,
             success=True,
         )
 
     except Exception as e:
         if aggregate_progress is not None:
+            assert progress_callback is not None
+            progress_callback.flush()
             aggregate_progress.fail_file()
 
         return DownloadResult(
             key=key,
             size=size,
-            checksum=etag.strip('"'),
+            checksum=etag,
             success=False,
             error=str(e),
         )
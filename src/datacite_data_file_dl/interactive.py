@@ -124,8 +124,11 @@ def select_download(
 
         if choice == "b":
             if path_stack:
-                path_stack.pop()
-                current_prefix = "/".join(path_stack) + "/" if path_stack else ""
+                # Maintain current_prefix incrementally: strip the popped
+                # segment and its trailing slash rather than re-joining
+                # the whole stack
+                popped = path_stack.pop()
+                current_prefix = current_prefix[: -(len(popped) + 1)]
             else:
                 print("Already at root.")
             continue
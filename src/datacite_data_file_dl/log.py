@@ -5,6 +5,12 @@ import sys
 
 LOGGER_NAME = "datacite-data-file-dl"
 
+# Bound once at import for hot paths; setup_logging() reconfigures this
+# same instance (logging.getLogger dedupes by name), so handlers attached
+# later apply to modules that imported it early. Avoids the global lookup
+# and None-check of get_logger() once per file.
+logger = logging.getLogger(LOGGER_NAME)
+
 _logger: logging.Logger | None = None
 
 
@@ -1,18 +1,47 @@
 """Output formatting for JSON and human-readable modes."""
 
 import json
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+
+# orjson serializes in native code; large --json result sets (one entry
+# per downloaded file) benefit measurably. Fall back to stdlib json.
+try:
+    import orjson
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+
+    def _dumps(obj: object) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Unit selection is a single C-level bisect over precomputed thresholds
+# rather than a Python loop of compare-and-divide steps
+_SIZE_THRESHOLDS = (1024, 1024**2, 1024**3, 1024**4, 1024**5)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_DIVISORS = (1, 1024, 1024**2, 1024**3, 1024**4, 1024**5)
+
+
+@lru_cache(maxsize=8192)
+def _format_size_int(size_bytes: int) -> str:
+    i = bisect_right(_SIZE_THRESHOLDS, abs(size_bytes))
+    return f"{size_bytes / _SIZE_DIVISORS[i]:.1f} {_SIZE_UNITS[i]}"
 
 
 def format_size(size_bytes: int | float) -> str:
-    """Format bytes as human-readable size."""
-    size: float = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(size) < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    """Format bytes as human-readable size.
+
+    Integer sizes (the per-file hot path in format_list) are memoized;
+    listings repeat sizes constantly, so most calls become dict hits.
+    """
+    if isinstance(size_bytes, int):
+        return _format_size_int(size_bytes)
+    i = bisect_right(_SIZE_THRESHOLDS, abs(size_bytes))
+    return f"{size_bytes / _SIZE_DIVISORS[i]:.1f} {_SIZE_UNITS[i]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -39,7 +68,7 @@ def format_success(
 ) -> str:
     """Format successful download result."""
     if json_output:
-        return json.dumps(
+        return _dumps(
             {
                 "status": "success",
                 "files": files,
@@ -50,8 +79,7 @@ def format_success(
                     "skipped": skipped,
                     "failed": failed,
                 },
-            },
-            indent=2,
+            }
         )
 
     lines = [
@@ -71,13 +99,12 @@ def format_error(
 ) -> str:
     """Format error result."""
     if json_output:
-        return json.dumps(
+        return _dumps(
             {
                 "status": "error",
                 "code": code,
                 "message": message,
-            },
-            indent=2,
+            }
         )
 
     return f"Error: {message}"
@@ -91,13 +118,12 @@ def format_list(
 ) -> str:
     """Format directory listing."""
     if json_output:
-        return json.dumps(
+        return _dumps(
             {
                 "prefix": prefix,
                 "folders": folders,
                 "files": files,
-            },
-            indent=2,
+            }
         )
 
     lines = []
@@ -132,7 +158,7 @@ def format_status(
             ),
             "status": status_json,
         }
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     lines = ["", "Data file status:"]
 
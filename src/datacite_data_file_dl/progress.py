@@ -1,18 +1,84 @@
 """Progress tracking and checkpointing for downloads."""
 
+import gzip
 import json
+import mmap
+import os
+import sys
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from threading import RLock
+from itertools import count
+from threading import Lock
+from typing import Iterable, cast
 
 from tqdm import tqdm
 
+# Snapshots and log lines serialize through orjson when installed (the
+# 'fast' extra); dicts from FileStatus.to_dict keep both backends and
+# the on-disk format identical.
+try:
+    import orjson
+
+    def _dumps_snapshot(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _loads_buffer(buf: memoryview) -> dict:
+        return cast(dict, orjson.loads(buf))
+except ImportError:
+
+    def _dumps_snapshot(obj: object) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj: object) -> str:
+        return json.dumps(obj)
+
+    def _loads_buffer(buf: memoryview) -> dict:
+        # stdlib json can't parse a memoryview directly
+        return cast(dict, json.loads(bytes(buf)))
+
 
 PROGRESS_FILE = ".datacite-data-file-dl-progress.json"
+# Snapshots compress extremely well (S3 keys share long prefixes), so
+# they are written gzipped at level 1: ~10x less checkpoint I/O for a
+# few ms of CPU. The uncompressed name is still read for back-compat.
+PROGRESS_FILE_GZ = PROGRESS_FILE + ".gz"
+PROGRESS_LOG = ".datacite-data-file-dl-progress.log"
+
+# Compact the append-only log into the JSON snapshot once this many
+# records have accumulated since the last snapshot
+COMPACT_THRESHOLD = 1000
+
+# Forward accumulated bytes to the aggregate tqdm bar at most this often
+# (or once this much has piled up); more frequent updates only redraw
+RENDER_INTERVAL_SECONDS = 0.1
+RENDER_BYTES = 1 << 20
 
+# completed_at timestamps only need second granularity; reformatting an
+# ISO string per completed file is measurable when thousands of small
+# files finish per second
+_last_iso: tuple[int, str] = (0, "")
 
-@dataclass
+
+def _iso_now() -> str:
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, datetime.now().isoformat())
+    return _last_iso[1]
+
+
+@dataclass(slots=True)
 class FileStatus:
     path: str
     size: int
@@ -32,7 +98,10 @@ class FileStatus:
     @classmethod
     def from_dict(cls, d: dict) -> "FileStatus":
         return cls(
-            path=d["path"],
+            # Interned so a path loaded from the snapshot, replayed from
+            # the log and re-marked in the same run all share one string
+            # object rather than three copies of the same key
+            path=sys.intern(d["path"]),
             size=d["size"],
             checksum=d["checksum"],
             completed=d.get("completed", False),
@@ -40,83 +109,267 @@ class FileStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressTracker:
-    """Track download progress with checkpoint support for resumable downloads."""
+    """Track download progress with checkpoint support for resumable downloads.
+
+    Completions append one JSON line each to a write-ahead log; the full
+    JSON snapshot is only rewritten on save() or when the log grows past
+    COMPACT_THRESHOLD records. Per-completion cost is O(1) instead of a
+    full O(N) checkpoint rewrite.
+    """
 
     output_dir: Path | str
     files: dict[str, FileStatus] = field(default_factory=dict)
     _loaded: bool = field(default=False, repr=False)
-    _lock: RLock = field(default_factory=RLock, repr=False)
+    # Plain Lock, not RLock: nothing re-enters, and Lock skips the
+    # owner-tracking overhead. Internal callers that already hold it go
+    # through _save_locked.
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _log_fd: int | None = field(default=None, repr=False)
+    _pending_log_records: int = field(default=0, repr=False)
+    # Running aggregates so get_stats is O(1) instead of rescanning
+    _files_completed: int = field(default=0, repr=False)
+    _bytes_completed: int = field(default=0, repr=False)
+    # Completed paths mirrored into a plain set so the read path never
+    # touches the lock: membership tests and list() are single C-level
+    # operations, atomic under the GIL, and writers mutate the set only
+    # while holding the lock. Readers can't block behind a compaction.
+    _completed_paths: set = field(default_factory=set, repr=False)
+    # Both paths are fixed for the tracker's lifetime; building them once
+    # here keeps Path allocations out of the per-completion hot path
+    _progress_file: Path = field(init=False, repr=False)
+    _legacy_progress_file: Path = field(init=False, repr=False)
+    _log_file: Path = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         if isinstance(self.output_dir, str):
             self.output_dir = Path(self.output_dir)
+        self._progress_file = self.output_dir / PROGRESS_FILE_GZ
+        self._legacy_progress_file = self.output_dir / PROGRESS_FILE
+        self._log_file = self.output_dir / PROGRESS_LOG
         self._load()
 
     @property
     def progress_file(self) -> Path:
-        assert isinstance(self.output_dir, Path)  # Converted in __post_init__
-        return self.output_dir / PROGRESS_FILE
+        return self._progress_file
+
+    @property
+    def log_file(self) -> Path:
+        return self._log_file
 
     def _load(self) -> None:
         if self._loaded:
             return
 
-        if self.progress_file.exists():
-            with open(self.progress_file) as f:
-                data = json.load(f)
-                for file_data in data.get("files", []):
-                    status = FileStatus.from_dict(file_data)
-                    self.files[status.path] = status
+        data: dict | None = None
+        if self._progress_file.exists():
+            raw = gzip.decompress(self._progress_file.read_bytes())
+            if raw:
+                data = _loads_buffer(memoryview(raw))
+        elif self._legacy_progress_file.exists():
+            # Uncompressed snapshot from an older version: map it instead
+            # of reading into an intermediate string; pages stream in on
+            # demand and the decoder works straight off the file's buffer
+            with open(self._legacy_progress_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > 0:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    view = memoryview(mm)
+                    try:
+                        data = _loads_buffer(view)
+                    finally:
+                        view.release()
+                        mm.close()
+
+        if data is not None:
+            # Snapshots are our own output: every record carries the full
+            # schema and paths are unique, so build the dict and totals in
+            # one direct pass instead of going through from_dict/_put_status
+            # per record
+            files = self.files
+            for d in data.get("files", []):
+                status = FileStatus(
+                    sys.intern(d["path"]),
+                    d["size"],
+                    d["checksum"],
+                    d["completed"],
+                    d["completed_at"],
+                )
+                files[status.path] = status
+                if status.completed:
+                    self._files_completed += 1
+                    self._bytes_completed += status.size
+                    self._completed_paths.add(status.path)
+
+        # Replay completions logged since the last snapshot
+        if self._log_file.exists():
+            with open(self._log_file) as f:
+                for line in f:
+                    try:
+                        status = FileStatus.from_dict(json.loads(line))
+                    except (json.JSONDecodeError, KeyError):
+                        continue  # Torn final record from an interrupted run
+                    self._put_status(status)
 
         self._loaded = True
 
+    def _put_status(self, status: FileStatus) -> None:
+        """Insert a status, keeping the running aggregates consistent."""
+        previous = self.files.get(status.path)
+        if previous is not None and previous.completed:
+            self._files_completed -= 1
+            self._bytes_completed -= previous.size
+        if status.completed:
+            self._files_completed += 1
+            self._bytes_completed += status.size
+            self._completed_paths.add(status.path)
+        else:
+            self._completed_paths.discard(status.path)
+        self.files[status.path] = status
+
+    def _append_records(self, statuses: list[FileStatus]) -> None:
+        """Append completion records to the log. Caller holds the lock.
+
+        The log fd is opened with O_APPEND, so each write lands at the
+        current end of file even if another process appends to the same
+        log; the in-process lock only protects the dict and counters.
+        """
+        self._log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._log_fd is None:
+            self._log_fd = os.open(
+                self._log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        os.write(
+            self._log_fd,
+            "".join(
+                _dumps_line(status.to_dict()) + "\n" for status in statuses
+            ).encode(),
+        )
+
+        self._pending_log_records += len(statuses)
+        if self._pending_log_records >= COMPACT_THRESHOLD:
+            self._save_locked()
+
     def save(self) -> None:
+        """Write a full snapshot and reset the append-only log."""
         with self._lock:
-            assert isinstance(self.output_dir, Path)  # Converted in __post_init__
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        self._progress_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Compaction truncates the shared log, so serialize against any
+        # other process compacting the same tracker directory; O_APPEND
+        # keeps plain appends safe without a lock
+        if fcntl is not None and self._log_fd is not None:
+            fcntl.flock(self._log_fd, fcntl.LOCK_EX)
+        try:
+            self._write_snapshot()
+        finally:
+            if fcntl is not None and self._log_fd is not None:
+                fcntl.flock(self._log_fd, fcntl.LOCK_UN)
+
+    def _write_snapshot(self) -> None:
+        data = {
+            "version": 1,
+            "updated_at": datetime.now().isoformat(),
+            "files": [status.to_dict() for status in self.files.values()],
+        }
 
-            data = {
-                "version": 1,
-                "updated_at": datetime.now().isoformat(),
-                "files": [status.to_dict() for status in self.files.values()],
-            }
+        # Write-then-replace keeps the snapshot atomic: a crash
+        # mid-write leaves the previous checkpoint intact instead of
+        # truncating it and forcing a from-scratch resume. The payload
+        # is preassembled bytes pushed through one unbuffered write
+        # rather than many small buffered ones.
+        payload = gzip.compress(_dumps_snapshot(data), compresslevel=1)
+        tmp = self._progress_file.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self._progress_file)
+        # Superseded by the compressed snapshot just written
+        self._legacy_progress_file.unlink(missing_ok=True)
+
+        # The snapshot now covers everything in the log
+        if self._log_fd is not None:
+            os.ftruncate(self._log_fd, 0)
+        else:
+            self._log_file.unlink(missing_ok=True)
+        self._pending_log_records = 0
 
-            with open(self.progress_file, "w") as f:
-                json.dump(data, f, indent=2)
+    def flush(self) -> None:
+        """Force a snapshot if any records were logged since the last one.
+
+        Batch boundaries (end of a parallel run) call this so the next
+        load starts from a compact snapshot instead of replaying the log.
+        """
+        with self._lock:
+            if self._pending_log_records:
+                self._save_locked()
 
     def mark_complete(self, path: str, size: int, checksum: str) -> None:
         with self._lock:
-            self.files[path] = FileStatus(
+            status = FileStatus(
                 path=path,
                 size=size,
                 checksum=checksum,
                 completed=True,
-                completed_at=datetime.now().isoformat(),
+                completed_at=_iso_now(),
             )
-            self.save()
+            self._put_status(status)
+            self._append_records([status])
 
-    def is_complete(self, path: str) -> bool:
+    def mark_complete_many(self, records: Iterable[tuple[str, int, str]]) -> None:
+        """Mark several (path, size, checksum) records complete in one log write."""
         with self._lock:
-            status = self.files.get(path)
-            return status is not None and status.completed
+            completed_at = _iso_now()
+            statuses = [
+                FileStatus(
+                    path=path,
+                    size=size,
+                    checksum=checksum,
+                    completed=True,
+                    completed_at=completed_at,
+                )
+                for path, size, checksum in records
+            ]
+            for status in statuses:
+                self._put_status(status)
+            self._append_records(statuses)
+
+    def is_complete(self, path: str) -> bool:
+        # Lock-free: a set membership test is one C call, and writers only
+        # add/discard entries under the lock. Reader latency stays flat no
+        # matter how contended the write path is.
+        return path in self._completed_paths
 
     def get_completed_files(self) -> list[str]:
-        return [path for path, status in self.files.items() if status.completed]
+        return list(self._completed_paths)
 
     def get_stats(self) -> dict:
-        completed = [s for s in self.files.values() if s.completed]
         return {
-            "files_completed": len(completed),
-            "bytes_completed": sum(s.size for s in completed),
+            "files_completed": self._files_completed,
+            "bytes_completed": self._bytes_completed,
         }
 
     def clear(self) -> None:
         with self._lock:
             self.files.clear()
-            if self.progress_file.exists():
-                self.progress_file.unlink()
+            self._completed_paths.clear()
+            self._files_completed = 0
+            self._bytes_completed = 0
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
+            self._pending_log_records = 0
+            self._progress_file.unlink(missing_ok=True)
+            self._legacy_progress_file.unlink(missing_ok=True)
+            self._log_file.unlink(missing_ok=True)
 
 
 class AggregateProgress:
@@ -130,11 +383,18 @@ class AggregateProgress:
     ) -> None:
         self.total_files = total_files
         self.total_bytes = total_bytes
-        self._lock = RLock()
+        # The lock guards only the tqdm bar; file counters advance via
+        # itertools.count, whose next() is a single C call and therefore
+        # atomic under the GIL — no mutex round-trip per completed file
+        self._lock = Lock()
         self._completed_bytes = 0
+        self._completed_count = count(1)
         self._completed_files = 0
+        self._failed_count = count(1)
         self._failed_files = 0
         self._show_progress = show_progress
+        self._pending_bytes = 0
+        self._last_render = time.monotonic()
 
         self._pbar: tqdm | None  # type: ignore[type-arg]
         if show_progress:
@@ -151,32 +411,48 @@ class AggregateProgress:
     def update(self, bytes_downloaded: int) -> None:
         with self._lock:
             self._completed_bytes += bytes_downloaded
-            if self._pbar is not None:
-                self._pbar.update(bytes_downloaded)
+            if self._pbar is None:
+                return
+            # Coalesce across workers: the bar only sees an update every
+            # RENDER_BYTES or RENDER_INTERVAL_SECONDS, whichever first
+            self._pending_bytes += bytes_downloaded
+            now = time.monotonic()
+            if (
+                self._pending_bytes >= RENDER_BYTES
+                or now - self._last_render >= RENDER_INTERVAL_SECONDS
+            ):
+                self._pbar.update(self._pending_bytes)
+                self._pending_bytes = 0
+                self._last_render = now
 
     def complete_file(self) -> None:
-        with self._lock:
-            self._completed_files += 1
-            if self._pbar is not None:
+        self._completed_files = next(self._completed_count)
+        if self._pbar is not None:
+            with self._lock:
                 self._pbar.set_postfix(
                     files=f"{self._completed_files}/{self.total_files}",
                     refresh=False,
                 )
 
     def fail_file(self) -> None:
-        with self._lock:
-            self._failed_files += 1
+        self._failed_files = next(self._failed_count)
 
     def close(self) -> None:
         if self._pbar is not None:
+            with self._lock:
+                if self._pending_bytes:
+                    self._pbar.update(self._pending_bytes)
+                    self._pending_bytes = 0
             self._pbar.close()
 
+    @property
+    def completed_bytes(self) -> int:
+        return self._completed_bytes
+
     @property
     def completed_files(self) -> int:
-        with self._lock:
-            return self._completed_files
+        return self._completed_files
 
     @property
     def failed_files(self) -> int:
-        with self._lock:
-            return self._failed_files
+        return self._failed_files
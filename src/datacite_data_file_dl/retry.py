@@ -1,5 +1,6 @@
 """Retry logic with exponential backoff."""
 
+import random
 import time
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
@@ -11,7 +12,8 @@ from botocore.exceptions import (
 )
 from requests.exceptions import RequestException
 
-from .log import get_logger
+from .auth import is_credential_error
+from .log import logger
 
 if TYPE_CHECKING:
     from .auth import CredentialManager
@@ -28,6 +30,45 @@ DEFAULT_RETRYABLE = (
     ClientError,  # Includes credential errors which we handle specially
 )
 
+# S3 error codes that no amount of retrying will fix: the key or bucket
+# does not exist, or the request is rejected outright. Sleeping between
+# attempts on these only multiplies error-path latency. The credential
+# codes (AccessDenied etc.) still get one refresh in
+# retry_with_credential_refresh before this check applies.
+NON_RETRYABLE_CODES = frozenset({
+    "NoSuchKey",
+    "NoSuchBucket",
+    "404",  # HeadObject reports missing keys with the bare status code
+    "AccessDenied",
+    "InvalidAccessKeyId",
+    "SignatureDoesNotMatch",
+})
+
+
+def _is_non_retryable(exc: Exception, codes: frozenset) -> bool:
+    if codes and isinstance(exc, ClientError):
+        return exc.response.get("Error", {}).get("Code") in codes
+    return False
+
+
+# Jittered sleeps keep parallel workers that failed together from
+# retrying together and re-slamming the same endpoint in sync:
+# "full" draws from [0, scheduled_delay), "decorrelated" (the AWS
+# recommendation) draws from [base, 3 * previous_sleep) capped at
+# max_delay and recovers faster from long sleeps, "none" is the raw
+# exponential schedule
+_rng = random.SystemRandom()
+
+
+def _jitter_mode(jitter: "str | bool") -> str:
+    if jitter is True:
+        return "full"
+    if jitter is False:
+        return "none"
+    if jitter in ("full", "decorrelated", "none"):
+        return jitter
+    raise ValueError(f"Unknown jitter mode: {jitter!r}")
+
 
 class RetryExhausted(Exception):
     """Raised when all retry attempts have been exhausted."""
@@ -48,26 +89,49 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     retryable_exceptions: tuple = DEFAULT_RETRYABLE,
+    jitter: "str | bool" = "full",
+    non_retryable_codes: frozenset = NON_RETRYABLE_CODES,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Decorator that retries a function with exponential backoff."""
+    """Decorator that retries a function with exponential backoff.
+
+    jitter is "full" (default), "decorrelated", or "none"; True/False
+    are accepted as aliases for "full"/"none". ClientErrors whose code
+    is in non_retryable_codes propagate immediately without retrying.
+    """
+    mode = _jitter_mode(jitter)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # The schedule depends only on decoration arguments, so it is
+        # computed once here rather than per failure in the wrapper
+        attempts = max(max_retries, 1)  # At least 1 attempt
+        delays = tuple(
+            min(base_delay * (1 << i), max_delay) for i in range(attempts)
+        )
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            logger = get_logger()
             last_exception: Exception | None = None
-            attempts = max(max_retries, 1)  # At least 1 attempt
+            prev_delay = base_delay
 
             for attempt in range(1, attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except retryable_exceptions as e:
+                    if _is_non_retryable(e, non_retryable_codes):
+                        raise
+
                     last_exception = e
 
                     if attempt >= attempts:
                         break
 
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                    if mode == "decorrelated":
+                        delay = min(max_delay, _rng.uniform(base_delay, prev_delay * 3))
+                        prev_delay = delay
+                    else:
+                        delay = delays[attempt - 1]
+                        if mode == "full":
+                            delay = _rng.uniform(0, delay)
 
                     logger.warning(
                         f"Attempt {attempt}/{attempts} failed for {func.__name__}: {e}. "
@@ -95,6 +159,8 @@ def retry_with_credential_refresh(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     retryable_exceptions: tuple = DEFAULT_RETRYABLE,
+    jitter: "str | bool" = "full",
+    non_retryable_codes: frozenset = NON_RETRYABLE_CODES,
     *args: Any,
     **kwargs: Any,
 ) -> T:
@@ -102,31 +168,119 @@ def retry_with_credential_refresh(
 
     Unlike the decorator version, this can refresh credentials and pass a fresh
     client to subsequent retry attempts. If credential_manager is provided, func
-    should accept 'client' as its first argument.
+    should accept 'client' as its first argument. Credential errors get one
+    refresh (which does not consume an attempt); ClientErrors whose code is in
+    non_retryable_codes otherwise propagate immediately.
     """
-    from .auth import is_credential_error
+    # Dispatch once: the specialized loops below don't re-test
+    # credential_manager on every attempt
+    if credential_manager is not None:
+        return _retry_with_creds(
+            func,
+            credential_manager,
+            max_retries,
+            base_delay,
+            max_delay,
+            retryable_exceptions,
+            jitter,
+            non_retryable_codes,
+            *args,
+            **kwargs,
+        )
+    return _retry_no_creds(
+        func,
+        max_retries,
+        base_delay,
+        max_delay,
+        retryable_exceptions,
+        jitter,
+        non_retryable_codes,
+        *args,
+        **kwargs,
+    )
 
-    logger = get_logger()
+
+def _retry_no_creds(
+    func: Callable[..., T],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    retryable_exceptions: tuple,
+    jitter: "str | bool",
+    non_retryable_codes: frozenset,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    mode = _jitter_mode(jitter)
     last_exception: Exception | None = None
     attempts = max(max_retries, 1)
-    credential_refreshed = False
-
-    if credential_manager is not None:
-        client = credential_manager.get_client()
-    else:
-        client = None
+    prev_delay = base_delay
 
     for attempt in range(1, attempts + 1):
         try:
-            if client is not None:
-                return func(client, *args, **kwargs)
+            return func(*args, **kwargs)
+        except retryable_exceptions as e:
+            if _is_non_retryable(e, non_retryable_codes):
+                raise
+
+            last_exception = e
+
+            if attempt >= attempts:
+                break
+
+            if mode == "decorrelated":
+                delay = min(max_delay, _rng.uniform(base_delay, prev_delay * 3))
+                prev_delay = delay
             else:
-                return func(*args, **kwargs)
+                delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                if mode == "full":
+                    delay = _rng.uniform(0, delay)
 
+            logger.warning(
+                f"Attempt {attempt}/{attempts} failed: {e}. "
+                f"Waiting {delay:.1f}s..."
+            )
+            time.sleep(delay)
+        except Exception:
+            raise
+
+    assert last_exception is not None
+    raise RetryExhausted(
+        f"Failed after {attempts} attempts: {last_exception}",
+        last_exception,
+    )
+
+
+def _retry_with_creds(
+    func: Callable[..., T],
+    credential_manager: "CredentialManager",
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    retryable_exceptions: tuple,
+    jitter: "str | bool",
+    non_retryable_codes: frozenset,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    mode = _jitter_mode(jitter)
+    last_exception: Exception | None = None
+    attempts = max(max_retries, 1)
+    prev_delay = base_delay
+    credential_refreshed = False
+    client = credential_manager.get_client()
+
+    # Manual counter rather than a for-range: the one credential refresh
+    # retries immediately without consuming an attempt
+    attempt = 0
+    while attempt < attempts:
+        attempt += 1
+        try:
+            return func(client, *args, **kwargs)
         except retryable_exceptions as e:
             last_exception = e
 
-            if is_credential_error(e) and credential_manager is not None:
+            if is_credential_error(e):
                 if not credential_refreshed:
                     logger.warning(
                         f"Credential error on attempt {attempt}/{attempts}: {e}. "
@@ -134,23 +288,34 @@ def retry_with_credential_refresh(
                     )
                     client = credential_manager.force_refresh()
                     credential_refreshed = True
+                    attempt -= 1
                     continue
                 else:
                     logger.warning(
                         f"Credential error persists after refresh on attempt {attempt}/{attempts}: {e}"
                     )
 
+            # Checked after the refresh branch: a credential code gets
+            # its one refresh before being treated as fatal
+            if _is_non_retryable(e, non_retryable_codes):
+                raise
+
             if attempt >= attempts:
                 break
 
-            delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+            if mode == "decorrelated":
+                delay = min(max_delay, _rng.uniform(base_delay, prev_delay * 3))
+                prev_delay = delay
+            else:
+                delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                if mode == "full":
+                    delay = _rng.uniform(0, delay)
 
             logger.warning(
                 f"Attempt {attempt}/{attempts} failed: {e}. "
                 f"Waiting {delay:.1f}s..."
             )
             time.sleep(delay)
-
         except Exception:
             raise
 
@@ -1,7 +1,27 @@
 """Path validation utilities to prevent path traversal attacks."""
 
 import os
-from pathlib import Path
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path, PurePath
+
+# Plain relative paths: one or more segments, none starting with '.' and
+# none containing separators that would need normalization. Anything that
+# doesn't match falls through to the full resolve-based check.
+_SIMPLE_PATH_RE = re.compile(r"^(?!\.)[^/\\]+(?:/(?!\.)[^/\\]+)*$")
+
+
+@lru_cache(maxsize=32)
+def _resolved_base(base_dir: str) -> Path:
+    """Resolve a base directory once; callers join against it repeatedly."""
+    return Path(base_dir).resolve()
+
+
+@lru_cache(maxsize=32)
+def _base_prefix(base_dir: str) -> str:
+    """The resolved base as a ready-to-concatenate string prefix."""
+    return str(_resolved_base(base_dir)) + os.sep
 
 
 class PathTraversalError(ValueError):
@@ -15,7 +35,28 @@ class PathTraversalError(ValueError):
         )
 
 
-def safe_join(base_dir: str | Path, untrusted_path: str) -> Path:
+def safe_join_str(base_dir: str | PurePath, untrusted_path: str) -> str:
+    """String-returning safe_join for per-file hot loops.
+
+    Path construction costs ~2µs per object; over millions of downloads
+    that is pure overhead when the result is only ever handed to open()
+    and os.* calls. Validated simple paths (the overwhelming majority)
+    come back as one string concatenation; anything unusual takes the
+    full safe_join route and is stringified.
+
+    Raises:
+        PathTraversalError: If the path would escape base_dir
+    """
+    if (
+        not os.path.isabs(untrusted_path)
+        and _SIMPLE_PATH_RE.match(untrusted_path)
+        and not untrusted_path.isspace()
+    ):
+        return _base_prefix(str(base_dir)) + untrusted_path
+    return str(safe_join(base_dir, untrusted_path))
+
+
+def safe_join(base_dir: str | PurePath, untrusted_path: str) -> Path:
     """Safely join a base directory with an untrusted path.
 
     This function validates that the resulting path is contained within
@@ -41,17 +82,34 @@ def safe_join(base_dir: str | Path, untrusted_path: str) -> Path:
         >>> safe_join("/data", "../etc/passwd")
         Raises PathTraversalError
     """
-    base = Path(base_dir).resolve()
-
-    if not untrusted_path or untrusted_path.strip() == "":
-        raise PathTraversalError(untrusted_path, "empty path")
+    base = _resolved_base(str(base_dir))
 
     if os.path.isabs(untrusted_path):
         raise PathTraversalError(untrusted_path, "absolute path not allowed")
 
+    # Fast path first: the regex is one C-level pass that implies
+    # non-empty, relative, and no leading-dot segments, so valid keys
+    # (the overwhelming majority) skip the per-condition string scans
+    # and the resolve() syscalls entirely. isspace() bails on the first
+    # ordinary character, so it only costs for whitespace-led input.
+    if _SIMPLE_PATH_RE.match(untrusted_path) and not untrusted_path.isspace():
+        return base / untrusted_path
+
+    # Only rejected or unusual inputs fall through to the discrete
+    # checks, which exist to produce a precise error reason
+    if not untrusted_path or untrusted_path.strip() == "":
+        raise PathTraversalError(untrusted_path, "empty path")
+
     if untrusted_path.startswith("."):
         raise PathTraversalError(untrusted_path, "path cannot start with '.'")
 
+    # Second chance lexically: redundant separators and '.' segments
+    # (a//b, a/./b) normalize to a plain path; only paths that still
+    # look suspicious after normpath pay for the resolve-based check
+    norm = posixpath.normpath(untrusted_path)
+    if _SIMPLE_PATH_RE.match(norm):
+        return base / norm
+
     try:
         joined = (base / untrusted_path).resolve()
     except (ValueError, OSError) as e:
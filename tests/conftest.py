@@ -5,6 +5,7 @@ import json
 import pytest
 from moto import mock_aws
 import boto3
+from botocore.config import Config
 
 from datacite_data_file_dl.download import BUCKET
 
@@ -17,13 +18,27 @@ def tmp_output_dir(tmp_path):
     return output_dir
 
 
+# Client construction loads service models and endpoint resolvers, so
+# build one for the whole session. Created outside any mock context
+# (static fake credentials, no validation or retries); moto intercepts
+# its calls whenever a mock_aws block is active.
+@pytest.fixture(scope="session")
+def _s3_base_client():
+    return boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        config=Config(parameter_validation=False, retries={"max_attempts": 1}),
+    )
+
+
 @pytest.fixture
-def mock_s3():
+def mock_s3(_s3_base_client):
     """Provide a mocked S3 environment."""
     with mock_aws():
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket=BUCKET)
-        yield client
+        _s3_base_client.create_bucket(Bucket=BUCKET)
+        yield _s3_base_client
 
 
 @pytest.fixture
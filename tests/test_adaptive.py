@@ -0,0 +1,85 @@
+"""Tests for the adaptive concurrency controller."""
+
+from datacite_data_file_dl.adaptive import AdaptiveConcurrency
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_controller(max_workers: int = 8) -> tuple[AdaptiveConcurrency, FakeClock, dict]:
+    clock = FakeClock()
+    counter = {"bytes": 0}
+    controller = AdaptiveConcurrency(
+        max_workers=max_workers,
+        bytes_completed=lambda: counter["bytes"],
+        sample_interval=1.0,
+        clock=clock,
+    )
+    return controller, clock, counter
+
+
+def sample(controller, clock, counter, delta_bytes: int) -> None:
+    """Advance one full interval with delta_bytes of progress, then adjust."""
+    clock.advance(1.0)
+    counter["bytes"] += delta_bytes
+    controller.maybe_adjust()
+
+
+class TestAdaptiveConcurrency:
+    """Test the hill-climbing worker limit."""
+
+    def test_starts_at_configured_cap(self):
+        controller, _, _ = make_controller(max_workers=8)
+        assert controller.limit == 8
+
+    def test_no_adjustment_before_interval(self):
+        controller, clock, counter = make_controller()
+        clock.advance(0.5)
+        counter["bytes"] += 1000
+        controller.maybe_adjust()
+        assert controller.limit == 8
+
+    def test_probes_down_while_throughput_holds(self):
+        """At equal or better throughput, fewer streams are preferred."""
+        controller, clock, counter = make_controller(max_workers=8)
+        sample(controller, clock, counter, 1000)
+        assert controller.limit == 7
+
+    def test_regrows_when_shrinking_hurts(self):
+        controller, clock, counter = make_controller(max_workers=8)
+        sample(controller, clock, counter, 1000)  # Probe down to 7
+        sample(controller, clock, counter, 500)  # Worse: reverse upward
+        assert controller.limit == 8
+
+    def test_stall_sheds_workers(self):
+        """Zero throughput walks the limit down toward min_workers."""
+        controller, clock, counter = make_controller(max_workers=4)
+        for _ in range(10):
+            sample(controller, clock, counter, 0)
+        assert controller.limit == 1
+
+    def test_limit_never_leaves_bounds(self):
+        controller, clock, counter = make_controller(max_workers=3)
+        deltas = [0, 0, 0, 0, 1000, 2000, 4000, 8000, 0, 16000, 0, 0]
+        for delta in deltas:
+            sample(controller, clock, counter, delta)
+            assert 1 <= controller.limit <= 3
+
+    def test_permits_track_active_workers(self):
+        controller, _, _ = make_controller(max_workers=2)
+        assert controller.active == 0
+        with controller:
+            assert controller.active == 1
+            with controller:
+                assert controller.active == 2
+        assert controller.active == 0
@@ -23,14 +23,14 @@ class TestAWSCredentials:
     """Tests for AWSCredentials dataclass."""
 
     def test_fetched_at_defaults_to_now(self):
-        """Should set fetched_at to current time by default."""
-        before = time.time()
+        """Should set fetched_at to the current monotonic time by default."""
+        before = time.monotonic()
         creds = AWSCredentials(
             access_key_id="key",
             secret_access_key="secret",
             session_token="token",
         )
-        after = time.time()
+        after = time.monotonic()
 
         assert before <= creds.fetched_at <= after
 
@@ -49,7 +49,7 @@ class TestAWSCredentials:
         # Credentials are considered expiring when age >= (lifetime - buffer)
         # With default refresh interval of 1200s, buffer = 3600 - 1200 = 2400s
         default_buffer = DEFAULT_CREDENTIAL_LIFETIME_SECONDS - DEFAULT_REFRESH_INTERVAL_SECONDS
-        old_time = time.time() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - default_buffer + 10)
+        old_time = time.monotonic() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - default_buffer + 10)
         creds = AWSCredentials(
             access_key_id="key",
             secret_access_key="secret",
@@ -74,7 +74,7 @@ class TestAWSCredentials:
 
     def test_seconds_until_expiry_never_negative(self):
         """Should return 0 when expired, not negative."""
-        old_time = time.time() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS + 100)
+        old_time = time.monotonic() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS + 100)
         creds = AWSCredentials(
             access_key_id="key",
             secret_access_key="secret",
@@ -103,7 +103,7 @@ class TestCredentialManager:
         manager = CredentialManager("user", "pass")
         client = manager.get_client()
 
-        mock_fetch.assert_called_once_with("user", "pass")
+        mock_fetch.assert_called_once_with("user", "pass", session=manager._http)
         mock_boto_client.assert_called_once()
         assert client == mock_s3_client
         assert manager.refresh_count == 1
@@ -139,7 +139,7 @@ class TestCredentialManager:
             access_key_id="key1",
             secret_access_key="secret1",
             session_token="token1",
-            fetched_at=time.time() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 100),  # 100s left
+            fetched_at=time.monotonic() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 100),  # 100s left
         )
         new_creds = AWSCredentials(
             access_key_id="key2",
@@ -163,7 +163,7 @@ class TestCredentialManager:
         """Should handle concurrent access safely."""
         call_count = 0
 
-        def mock_fetch_delayed(*args):
+        def mock_fetch_delayed(*args, **kwargs):
             nonlocal call_count
             call_count += 1
             time.sleep(0.1)  # Simulate network delay
@@ -208,7 +208,7 @@ class TestCredentialManager:
             access_key_id="key1",
             secret_access_key="secret1",
             session_token="token1",
-            fetched_at=time.time() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 100),
+            fetched_at=time.monotonic() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 100),
         )
         new_creds = AWSCredentials(
             access_key_id="key2",
@@ -284,7 +284,7 @@ class TestCredentialManager:
             access_key_id="key1",
             secret_access_key="secret1",
             session_token="token1",
-            fetched_at=time.time() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 700),  # 700s left
+            fetched_at=time.monotonic() - (DEFAULT_CREDENTIAL_LIFETIME_SECONDS - 700),  # 700s left
         )
         mock_fetch.return_value = fresh_creds
         mock_boto_client.return_value = MagicMock()
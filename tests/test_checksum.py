@@ -4,76 +4,117 @@ import hashlib
 
 import pytest
 
-from datacite_data_file_dl.checksum import verify_checksum, compute_md5, ChecksumMismatch
+from datacite_data_file_dl.checksum import (
+    verify_checksum,
+    compute_blake3,
+    compute_md5,
+    ChecksumMismatch,
+)
+from datacite_data_file_dl import checksum as checksum_module
+
+HELLO = b"hello world"
+HELLO_MD5 = hashlib.md5(HELLO).hexdigest()
+
+# md5(b"x" * (1024 * 1024 + 7)), frozen so the test doesn't hash the
+# payload a second time just to produce its own reference
+LARGE_PAYLOAD_SIZE = 1024 * 1024 + 7
+LARGE_PAYLOAD_MD5 = "64bf27d83fee225caf55f6b4a0f80f18"
+
+
+# Most tests here hash the same 11-byte payload and never mutate it, so
+# write it to disk once instead of once per test
+@pytest.fixture(scope="module")
+def hello_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("checksum") / "test.txt"
+    path.write_bytes(HELLO)
+    return path
+
+
+# Session scope: nothing mutates the payload, so one write covers the
+# whole run (and repeated --lf reruns within it)
+@pytest.fixture(scope="session")
+def large_md5_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("big") / "large.bin"
+    # Just over 1MB, and not a multiple of any plausible chunk size,
+    # so the final read is a partial chunk
+    path.write_bytes(b"x" * LARGE_PAYLOAD_SIZE)
+    return path
 
 
 class TestComputeMd5:
     """Test MD5 computation."""
 
-    def test_compute_md5(self, tmp_path):
+    def test_compute_md5(self, hello_file):
         """Should compute correct MD5 hash."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"hello world")
+        assert compute_md5(hello_file) == HELLO_MD5
 
-        expected = hashlib.md5(b"hello world").hexdigest()
-        actual = compute_md5(test_file)
+    def test_compute_md5_large_file(self, large_md5_file):
+        """Should handle files larger than the read buffer."""
+        assert compute_md5(large_md5_file) == LARGE_PAYLOAD_MD5
 
-        assert actual == expected
 
-    def test_compute_md5_large_file(self, tmp_path):
-        """Should handle large files efficiently."""
-        test_file = tmp_path / "large.bin"
-        # Create 10MB file
-        data = b"x" * (10 * 1024 * 1024)
-        test_file.write_bytes(data)
+class TestComputeBlake3:
+    """Test optional BLAKE3 hashing."""
 
-        expected = hashlib.md5(data).hexdigest()
-        actual = compute_md5(test_file)
+    def test_compute_blake3(self, hello_file):
+        """Should hash the file when blake3 is installed, else return None."""
+        result = compute_blake3(hello_file)
 
-        assert actual == expected
+        if checksum_module._blake3 is None:
+            assert result is None
+        else:
+            assert result == checksum_module._blake3.blake3(HELLO).hexdigest()
 
 
 class TestVerifyChecksum:
     """Test checksum verification."""
 
-    def test_verify_success(self, tmp_path):
+    def test_verify_success(self, hello_file):
         """Should pass when checksum matches."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"hello world")
-
-        expected = hashlib.md5(b"hello world").hexdigest()
         # S3 ETag format: "hash" (with quotes) or just hash
 
         # Should not raise
-        verify_checksum(test_file, expected)
+        verify_checksum(hello_file, HELLO_MD5)
 
-    def test_verify_with_quoted_etag(self, tmp_path):
+    def test_verify_with_quoted_etag(self, hello_file):
         """Should handle S3 ETags with surrounding quotes."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"hello world")
+        verify_checksum(hello_file, f'"{HELLO_MD5}"')
 
-        expected = hashlib.md5(b"hello world").hexdigest()
-        etag = f'"{expected}"'
-
-        verify_checksum(test_file, etag)
-
-    def test_verify_failure(self, tmp_path):
+    def test_verify_failure(self, hello_file):
         """Should raise ChecksumMismatch on mismatch."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"hello world")
-
         with pytest.raises(ChecksumMismatch) as exc_info:
-            verify_checksum(test_file, "wrong_checksum")
+            verify_checksum(hello_file, "wrong_checksum")
 
         assert "wrong_checksum" in str(exc_info.value)
 
-    def test_skip_multipart_etag(self, tmp_path):
-        """Should skip verification for multipart upload ETags."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"hello world")
-
-        # Multipart ETags have format: hash-partcount
+    def test_skip_multipart_etag(self, hello_file):
+        """Should skip verification for multipart upload ETAGs with unknown part size."""
+        # Multipart ETags have format: hash-partcount; no common part size
+        # yields 5 parts for an 11-byte file, so verification is skipped
         multipart_etag = "abc123-5"
 
         # Should not raise, just skip verification
-        verify_checksum(test_file, multipart_etag)
+        verify_checksum(hello_file, multipart_etag)
+
+    def test_verify_multipart_etag(self, tmp_path):
+        """Should verify multipart ETags when the part size can be inferred."""
+        part_size = 8 * 1024 * 1024
+        data = b"x" * (part_size + 1024)  # Two parts at the 8MB default
+        test_file = tmp_path / "multipart.bin"
+        test_file.write_bytes(data)
+
+        part_digests = hashlib.md5(data[:part_size]).digest() + hashlib.md5(
+            data[part_size:]
+        ).digest()
+        etag = f"{hashlib.md5(part_digests).hexdigest()}-2"
+
+        verify_checksum(test_file, etag)
+
+    def test_verify_multipart_etag_mismatch(self, tmp_path):
+        """Should raise ChecksumMismatch for a wrong multipart ETag."""
+        part_size = 8 * 1024 * 1024
+        test_file = tmp_path / "multipart.bin"
+        test_file.write_bytes(b"x" * (part_size + 1024))
+
+        with pytest.raises(ChecksumMismatch):
+            verify_checksum(test_file, "0" * 32 + "-2")
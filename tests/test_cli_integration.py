@@ -7,26 +7,94 @@ from unittest.mock import MagicMock, patch
 import pytest
 from moto import mock_aws
 import boto3
+from botocore import UNSIGNED
+from botocore.config import Config
 
 from datacite_data_file_dl.__main__ import main
 from datacite_data_file_dl.download import BUCKET
 from datacite_data_file_dl.exit_codes import ExitCode
 
-
-def create_mock_auth_response():
-    """Create a mock authentication API response."""
-    mock_response = MagicMock()
-    mock_response.ok = True
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "access_key_id": "test-key-id",
-        "secret_access_key": "test-secret",
-        "session_token": "test-token",
-    }
-    return mock_response
+# Everything here stands up a moto backend; deselect with -m 'not integration'
+pytestmark = pytest.mark.integration
+
+
+# One shared auth response for every test: MagicMock construction is
+# surprisingly costly under pytest and nothing here mutates the object
+_AUTH_RESPONSE = MagicMock(ok=True, status_code=200)
+_AUTH_RESPONSE.json.return_value = {
+    "access_key_id": "test-key-id",
+    "secret_access_key": "test-secret",
+    "session_token": "test-token",
+}
+
+
+# CredentialManager fetches via a reusable requests.Session, so patch at
+# the Session level to intercept its keep-alive requests
+AUTH_PATCH_PATH = "requests.Session.get"
+
+
+def _argv(*extra: str) -> list[str]:
+    """argv with the credential prefix every download test shares."""
+    return ["datacite-data-file-dl", "-u", "user", "-p", "pass", *extra]
+
+
+# moto backend setup and boto3 client construction dominate this file's
+# runtime, so both are shared module-wide; the function-scoped s3
+# fixture empties the backend between tests instead of tearing moto
+# down. Module scope, not session: while this mock is active, other
+# files' nested mock_aws blocks would stop resetting state on exit.
+@pytest.fixture(scope="module")
+def aws():
+    with mock_aws():
+        yield
+
+
+@pytest.fixture(scope="module")
+def s3_client(aws):
+    # No parameter validation or request signing for seeding calls:
+    # both are pure CPU in botocore that moto never checks
+    client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        config=Config(parameter_validation=False, signature_version=UNSIGNED),
+    )
+    # The default bucket outlives individual tests; only its contents
+    # are wiped between them
+    client.create_bucket(Bucket=BUCKET)
+    return client
+
+
+def seed_bucket(client, bucket, items):
+    """Fill a bucket with {key: body} objects, creating it if non-default."""
+    if bucket != BUCKET:
+        client.create_bucket(Bucket=bucket)
+    for key, body in items.items():
+        client.put_object(Bucket=bucket, Key=key, Body=body)
+
+
+@pytest.fixture
+def s3(s3_client):
+    yield s3_client
+    for bucket in s3_client.list_buckets()["Buckets"]:
+        name = bucket["Name"]
+        objects = s3_client.list_objects_v2(Bucket=name).get("Contents", [])
+        if objects:
+            s3_client.delete_objects(
+                Bucket=name,
+                Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]},
+            )
+        if name != BUCKET:
+            s3_client.delete_bucket(Bucket=name)
 
 
-AUTH_PATCH_PATH = "datacite_data_file_dl.auth.requests.get"
+# Autouse: every test in this module goes through main(), which hits
+# the auth endpoint first; tests that need a different response mutate
+# the yielded mock instead of stacking their own patch
+@pytest.fixture(autouse=True)
+def mock_auth():
+    with patch(AUTH_PATCH_PATH) as mock_get:
+        mock_get.return_value = _AUTH_RESPONSE
+        yield mock_get
 
 
 class TestCLIAuthFailures:
@@ -60,549 +128,344 @@ class TestCLIAuthFailures:
         output = json.loads(captured.out)
         assert output["status"] == "error"
 
-    def test_auth_api_failure(self, capsys, monkeypatch):
+    def test_auth_api_failure(self, capsys, monkeypatch, mock_auth):
         """Should fail with AUTH_FAILURE when API returns error."""
-        with patch(AUTH_PATCH_PATH) as mock_post:
-            mock_response = MagicMock()
-            mock_response.ok = False
-            mock_response.status_code = 401
-            mock_response.text = "Unauthorized"
-            mock_post.return_value = mock_response
-
-            monkeypatch.setattr(
-                sys,
-                "argv",
-                ["datacite-data-file-dl", "-u", "bad", "-p", "creds", "--json", "--list"],
-            )
+        mock_response = MagicMock()
+        mock_response.ok = False
+        mock_response.status_code = 401
+        mock_response.text = "Unauthorized"
+        mock_auth.return_value = mock_response
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["datacite-data-file-dl", "-u", "bad", "-p", "creds", "--json", "--list"],
+        )
 
-            result = main()
+        result = main()
 
-            assert result == ExitCode.AUTH_FAILURE
+        assert result == ExitCode.AUTH_FAILURE
 
 
 class TestCLIListMode:
     """Test --list mode functionality."""
 
-    def test_list_mode_json(self, capsys, monkeypatch):
+    def test_list_mode_json(self, capsys, monkeypatch, s3):
         """Should list bucket contents in JSON format."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"content")
-                client.put_object(Bucket=BUCKET, Key="dois/updated_2024-01/file.json", Body=b"{}")
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--list",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert "folders" in output
-                assert "files" in output
-                assert "dois" in output["folders"]
-                assert any(f["name"] == "MANIFEST" for f in output["files"])
-
-    def test_list_mode_with_path(self, capsys, monkeypatch):
+        seed_bucket(
+            s3,
+            BUCKET,
+            {"MANIFEST": b"content", "dois/updated_2024-01/file.json": b"{}"},
+        )
+
+        monkeypatch.setattr(sys, "argv", _argv("--list", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert "folders" in output
+        assert "files" in output
+        assert "dois" in output["folders"]
+        assert any(f["name"] == "MANIFEST" for f in output["files"])
+
+    def test_list_mode_with_path(self, capsys, monkeypatch, s3):
         """Should list contents under a specific path."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="dois/updated_2024-01/file.json", Body=b"{}")
-                client.put_object(Bucket=BUCKET, Key="dois/updated_2024-02/file.json", Body=b"{}")
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--list",
-                        "--path",
-                        "dois",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert "updated_2024-01" in output["folders"]
-                assert "updated_2024-02" in output["folders"]
+        seed_bucket(
+            s3,
+            BUCKET,
+            {
+                "dois/updated_2024-01/file.json": b"{}",
+                "dois/updated_2024-02/file.json": b"{}",
+            },
+        )
+
+        monkeypatch.setattr(sys, "argv", _argv("--list", "--path", "dois", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert "updated_2024-01" in output["folders"]
+        assert "updated_2024-02" in output["folders"]
 
 
 class TestCLIDryRun:
     """Test --dry-run functionality."""
 
-    def test_dry_run_shows_files(self, capsys, monkeypatch):
+    def test_dry_run_shows_files(self, capsys, monkeypatch, s3):
         """Should show what would be downloaded without downloading."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"content")
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--all",
-                        "--dry-run",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                assert "Would download: MANIFEST" in captured.out
+        seed_bucket(s3, BUCKET, {"MANIFEST": b"content"})
+
+        monkeypatch.setattr(sys, "argv", _argv("--all", "--dry-run"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        assert "Would download: MANIFEST" in captured.out
 
 
 class TestCLIDownload:
     """Test actual download functionality."""
 
-    def test_download_single_file(self, tmp_path, capsys, monkeypatch):
+    def test_download_single_file(self, tmp_path, capsys, monkeypatch, s3):
         """Should download a single file successfully."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="test.txt", Body=b"test content")
-
-                output_dir = tmp_path / "output"
-                output_dir.mkdir()
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--all",
-                        "-o",
-                        str(output_dir),
-                        "--json",
-                        "-y",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                assert (output_dir / "test.txt").exists()
-                assert (output_dir / "test.txt").read_text() == "test content"
-
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert output["status"] == "success"
-                assert len(output["files"]) == 1
-
-    def test_download_with_path(self, tmp_path, capsys, monkeypatch):
+        seed_bucket(s3, BUCKET, {"test.txt": b"test content"})
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            _argv(
+                "--all",
+                "-o",
+                str(output_dir),
+                "--json",
+                "-y",
+            ),
+        )
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        assert (output_dir / "test.txt").exists()
+        assert (output_dir / "test.txt").read_text() == "test content"
+
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output["status"] == "success"
+        assert len(output["files"]) == 1
+
+    def test_download_with_path(self, tmp_path, capsys, monkeypatch, s3):
         """Should download files under specific path only."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"manifest")
-                client.put_object(Bucket=BUCKET, Key="dois/updated_2024-01/file.json", Body=b"{}")
-
-                output_dir = tmp_path / "output"
-                output_dir.mkdir()
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--path",
-                        "dois/updated_2024-01",
-                        "-o",
-                        str(output_dir),
-                        "--json",
-                        "-y",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                # Only the file under the path should be downloaded
-                assert (output_dir / "file.json").exists()
-                # Root MANIFEST should not be downloaded
-                assert not (output_dir / "MANIFEST").exists()
-
-    def test_download_not_found(self, capsys, monkeypatch):
+        seed_bucket(
+            s3,
+            BUCKET,
+            {"MANIFEST": b"manifest", "dois/updated_2024-01/file.json": b"{}"},
+        )
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            _argv(
+                "--path",
+                "dois/updated_2024-01",
+                "-o",
+                str(output_dir),
+                "--json",
+                "-y",
+            ),
+        )
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        # Only the file under the path should be downloaded
+        assert (output_dir / "file.json").exists()
+        # Root MANIFEST should not be downloaded
+        assert not (output_dir / "MANIFEST").exists()
+
+    def test_download_not_found(self, capsys, monkeypatch, s3):
         """Should return NOT_FOUND when no files match."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--path",
-                        "nonexistent/",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.NOT_FOUND
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert output["status"] == "error"
-                assert output["code"] == "NOT_FOUND"
+        seed_bucket(s3, BUCKET, {})
+
+        monkeypatch.setattr(sys, "argv", _argv("--path", "nonexistent/", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.NOT_FOUND
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output["status"] == "error"
+        assert output["code"] == "NOT_FOUND"
 
 
 class TestCLIFiltering:
     """Test file filtering options."""
 
-    def test_include_pattern(self, tmp_path, capsys, monkeypatch):
+    def test_include_pattern(self, tmp_path, capsys, monkeypatch, s3):
         """Should only download files matching include pattern."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="file1.json", Body=b"{}")
-                client.put_object(Bucket=BUCKET, Key="file2.txt", Body=b"text")
-                client.put_object(Bucket=BUCKET, Key="file3.json", Body=b"{}")
-
-                output_dir = tmp_path / "output"
-                output_dir.mkdir()
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--all",
-                        "-o",
-                        str(output_dir),
-                        "--include",
-                        "*.json",
-                        "--json",
-                        "-y",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                assert (output_dir / "file1.json").exists()
-                assert (output_dir / "file3.json").exists()
-                assert not (output_dir / "file2.txt").exists()
-
-    def test_exclude_pattern(self, tmp_path, capsys, monkeypatch):
+        seed_bucket(
+            s3,
+            BUCKET,
+            {"file1.json": b"{}", "file2.txt": b"text", "file3.json": b"{}"},
+        )
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            _argv(
+                "--all",
+                "-o",
+                str(output_dir),
+                "--include",
+                "*.json",
+                "--json",
+                "-y",
+            ),
+        )
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        assert (output_dir / "file1.json").exists()
+        assert (output_dir / "file3.json").exists()
+        assert not (output_dir / "file2.txt").exists()
+
+    def test_exclude_pattern(self, tmp_path, capsys, monkeypatch, s3):
         """Should skip files matching exclude pattern."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="keep.json", Body=b"{}")
-                client.put_object(Bucket=BUCKET, Key="skip.tmp", Body=b"temp")
-
-                output_dir = tmp_path / "output"
-                output_dir.mkdir()
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--all",
-                        "-o",
-                        str(output_dir),
-                        "--exclude",
-                        "*.tmp",
-                        "--json",
-                        "-y",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                assert (output_dir / "keep.json").exists()
-                assert not (output_dir / "skip.tmp").exists()
+        seed_bucket(s3, BUCKET, {"keep.json": b"{}", "skip.tmp": b"temp"})
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            _argv(
+                "--all",
+                "-o",
+                str(output_dir),
+                "--exclude",
+                "*.tmp",
+                "--json",
+                "-y",
+            ),
+        )
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        assert (output_dir / "keep.json").exists()
+        assert not (output_dir / "skip.tmp").exists()
 
 
 class TestCLIBucketConfig:
     """Test custom bucket configuration."""
 
-    def test_custom_bucket(self, capsys, monkeypatch):
+    def test_custom_bucket(self, capsys, monkeypatch, s3):
         """Should use custom bucket when specified."""
         custom_bucket = "my-custom-bucket"
 
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=custom_bucket)
-                client.put_object(Bucket=custom_bucket, Key="custom-file.txt", Body=b"custom")
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--bucket",
-                        custom_bucket,
-                        "--list",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert any(f["name"] == "custom-file.txt" for f in output["files"])
+        seed_bucket(s3, custom_bucket, {"custom-file.txt": b"custom"})
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            _argv(
+                "--bucket",
+                custom_bucket,
+                "--list",
+                "--json",
+            ),
+        )
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert any(f["name"] == "custom-file.txt" for f in output["files"])
 
 
 class TestCLIStatus:
     """Test --status functionality."""
 
-    def test_status_json_output(self, capsys, monkeypatch):
+    def test_status_json_output(self, capsys, monkeypatch, s3):
         """Should output status info as JSON."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"content")
-                client.put_object(
-                    Bucket=BUCKET,
-                    Key="STATUS.json",
-                    Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
-                )
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--status",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert "manifest_last_modified" in output
-                assert output["manifest_last_modified"] is not None
-                assert output["status"]["month"] == "2026-02"
-                assert output["status"]["status"] == "Complete"
-
-    def test_status_human_readable(self, capsys, monkeypatch):
+        seed_bucket(s3, BUCKET, {"MANIFEST": b"content"})
+        s3.put_object(
+            Bucket=BUCKET,
+            Key="STATUS.json",
+            Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
+        )
+
+        monkeypatch.setattr(sys, "argv", _argv("--status", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert "manifest_last_modified" in output
+        assert output["manifest_last_modified"] is not None
+        assert output["status"]["month"] == "2026-02"
+        assert output["status"]["status"] == "Complete"
+
+    def test_status_human_readable(self, capsys, monkeypatch, s3):
         """Should output human-readable status."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"content")
-                client.put_object(
-                    Bucket=BUCKET,
-                    Key="STATUS.json",
-                    Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
-                )
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--status",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                assert "Data file status:" in captured.out
-                assert "2026-02" in captured.out
-                assert "Complete" in captured.out
-
-    def test_status_missing_manifest(self, capsys, monkeypatch):
+        seed_bucket(s3, BUCKET, {"MANIFEST": b"content"})
+        s3.put_object(
+            Bucket=BUCKET,
+            Key="STATUS.json",
+            Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
+        )
+
+        monkeypatch.setattr(sys, "argv", _argv("--status"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        assert "Data file status:" in captured.out
+        assert "2026-02" in captured.out
+        assert "Complete" in captured.out
+
+    def test_status_missing_manifest(self, capsys, monkeypatch, s3):
         """Should handle missing MANIFEST gracefully."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                # Only STATUS.json, no MANIFEST
-                client.put_object(
-                    Bucket=BUCKET,
-                    Key="STATUS.json",
-                    Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
-                )
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--status",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert output["manifest_last_modified"] is None
-                assert output["status"]["month"] == "2026-02"
-
-    def test_status_missing_status_json(self, capsys, monkeypatch):
+        seed_bucket(s3, BUCKET, {})
+        # Only STATUS.json, no MANIFEST
+        s3.put_object(
+            Bucket=BUCKET,
+            Key="STATUS.json",
+            Body=json.dumps({"month": "2026-02", "status": "Complete"}).encode(),
+        )
+
+        monkeypatch.setattr(sys, "argv", _argv("--status", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output["manifest_last_modified"] is None
+        assert output["status"]["month"] == "2026-02"
+
+    def test_status_missing_status_json(self, capsys, monkeypatch, s3):
         """Should handle missing STATUS.json gracefully."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-                # Only MANIFEST, no STATUS.json
-                client.put_object(Bucket=BUCKET, Key="MANIFEST", Body=b"content")
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--status",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert output["manifest_last_modified"] is not None
-                assert output["status"] is None
-
-    def test_status_empty_bucket(self, capsys, monkeypatch):
+        seed_bucket(s3, BUCKET, {"MANIFEST": b"content"})
+
+        monkeypatch.setattr(sys, "argv", _argv("--status", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output["manifest_last_modified"] is not None
+        assert output["status"] is None
+
+    def test_status_empty_bucket(self, capsys, monkeypatch, s3):
         """Should handle empty bucket gracefully."""
-        with mock_aws():
-            with patch(AUTH_PATCH_PATH) as mock_post:
-                mock_post.return_value = create_mock_auth_response()
-
-                client = boto3.client("s3", region_name="us-east-1")
-                client.create_bucket(Bucket=BUCKET)
-
-                monkeypatch.setattr(
-                    sys,
-                    "argv",
-                    [
-                        "datacite-data-file-dl",
-                        "-u",
-                        "user",
-                        "-p",
-                        "pass",
-                        "--status",
-                        "--json",
-                    ],
-                )
-
-                result = main()
-
-                assert result == ExitCode.SUCCESS
-                captured = capsys.readouterr()
-                output = json.loads(captured.out)
-                assert output["manifest_last_modified"] is None
-                assert output["status"] is None
+        seed_bucket(s3, BUCKET, {})
+
+        monkeypatch.setattr(sys, "argv", _argv("--status", "--json"))
+
+        result = main()
+
+        assert result == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output["manifest_last_modified"] is None
+        assert output["status"] is None
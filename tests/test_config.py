@@ -2,70 +2,70 @@
 
 from unittest.mock import patch
 
+import pytest
 
 from datacite_data_file_dl.config import load_config
 
 
-class TestEnvironmentVariables:
-    """Test loading config from environment variables."""
-
-    def test_load_username_from_env(self, monkeypatch):
-        """Username should be loaded from DATACITE_USERNAME."""
-        monkeypatch.setenv("DATACITE_USERNAME", "test-user")
-        config = load_config()
-        assert config.username == "test-user"
-
-    def test_load_password_from_env(self, monkeypatch):
-        """Password should be loaded from DATACITE_PASSWORD."""
-        monkeypatch.setenv("DATACITE_PASSWORD", "test-pass")
-        config = load_config()
-        assert config.password == "test-pass"
-
-    def test_cli_args_override_env(self, monkeypatch):
-        """CLI arguments should take precedence over env vars."""
-        monkeypatch.setenv("DATACITE_USERNAME", "env-user")
-        config = load_config(cli_username="cli-user")
-        assert config.username == "cli-user"
-
-    def test_missing_credentials_returns_none(self):
-        """Missing credentials should be None, not raise."""
-        config = load_config()
-        assert config.username is None
-        assert config.password is None
-
-
-class TestConfigFile:
-    """Test loading config from TOML file."""
-
-    def test_load_username_from_config_file(self, tmp_path, monkeypatch):
-        """Username should be loaded from config file."""
+# Each case populates some combination of env vars, a TOML file, and CLI
+# kwargs, then checks one resulting field; "{tmp}" in file text or the
+# expected value is replaced with the test's tmp_path
+@pytest.mark.parametrize(
+    "env,file_text,kwargs,attr,expected",
+    [
+        ({"DATACITE_USERNAME": "test-user"}, None, {}, "username", "test-user"),
+        ({"DATACITE_PASSWORD": "test-pass"}, None, {}, "password", "test-pass"),
+        (
+            {"DATACITE_USERNAME": "env-user"},
+            None,
+            {"cli_username": "cli-user"},
+            "username",
+            "cli-user",
+        ),
+        ({}, None, {}, "username", None),
+        ({}, None, {}, "password", None),
+        ({}, 'username = "file-user"\n', {}, "username", "file-user"),
+        ({}, 'output_dir = "{tmp}/data"\n', {}, "output_dir", "{tmp}/data"),
+        (
+            {"DATACITE_USERNAME": "env-user"},
+            'username = "file-user"\n',
+            {},
+            "username",
+            "env-user",
+        ),
+    ],
+    ids=[
+        "username_from_env",
+        "password_from_env",
+        "cli_overrides_env",
+        "missing_username_is_none",
+        "missing_password_is_none",
+        "username_from_file",
+        "output_dir_from_file",
+        "env_overrides_file",
+    ],
+)
+def test_source_precedence(env, file_text, kwargs, attr, expected, tmp_path, monkeypatch):
+    """Each config source should feed the expected field, CLI > env > file."""
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    if file_text is not None:
         config_file = tmp_path / "config.toml"
-        config_file.write_text('username = "file-user"\n')
+        config_file.write_text(file_text.format(tmp=tmp_path))
+        kwargs = {**kwargs, "config_file": str(config_file)}
 
-        config = load_config(config_file=str(config_file))
-        assert config.username == "file-user"
-
-    def test_load_output_dir_from_config_file(self, tmp_path, monkeypatch):
-        """Output dir should be loaded and expanded from config file."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text(f'output_dir = "{tmp_path}/data"\n')
+    config = load_config(**kwargs)
 
-        config = load_config(config_file=str(config_file))
-        assert config.output_dir == str(tmp_path / "data")
-
-    def test_env_overrides_config_file(self, tmp_path, monkeypatch):
-        """Env vars should take precedence over config file."""
-        config_file = tmp_path / "config.toml"
-        config_file.write_text('username = "file-user"\n')
-        monkeypatch.setenv("DATACITE_USERNAME", "env-user")
+    if isinstance(expected, str):
+        expected = expected.format(tmp=tmp_path)
+    assert getattr(config, attr) == expected
 
-        config = load_config(config_file=str(config_file))
-        assert config.username == "env-user"
 
-    def test_missing_config_file_is_ok(self):
-        """Missing config file should not raise."""
-        config = load_config(config_file="/nonexistent/path/config.toml")
-        assert config.username is None
+def test_missing_config_file_is_ok():
+    """Missing config file should not raise."""
+    config = load_config(config_file="/nonexistent/path/config.toml")
+    assert config.username is None
 
 
 class TestConfigPrecedence:
@@ -4,6 +4,9 @@ import pytest
 from botocore.exceptions import ClientError
 
 from datacite_data_file_dl.download import (
+    DownloadItem,
+    filter_objects,
+    prepare_output_tree,
     get_manifest_metadata,
     get_status_json,
     should_download_file,
@@ -104,6 +107,73 @@ class TestShouldDownloadFile:
         assert result is False
 
 
+class TestFilterObjects:
+    """Test the batch filtering path."""
+
+    def _objects(self):
+        return [
+            {"Key": "dois/part-001.json", "Size": 100, "ETag": '"abc"'},
+            {"Key": "dois/part-002.json", "Size": 9000, "ETag": '"def"'},
+            {"Key": "dois/readme.txt", "Size": 50, "ETag": '"ghi"'},
+            {"Key": "dois/done.json", "Size": 100, "ETag": '"jkl"'},
+        ]
+
+    def test_matches_per_object_filtering(self, tmp_output_dir):
+        """Batch filtering must agree with should_download_file."""
+        tracker = ProgressTracker(tmp_output_dir)
+        tracker.mark_complete("dois/done.json", size=100, checksum="jkl")
+
+        items, skipped = filter_objects(
+            self._objects(),
+            prefix="",
+            tracker=tracker,
+            include_patterns=["*.json"],
+            max_size=500,
+        )
+
+        assert [item.key for item in items] == ["dois/part-001.json"]
+        assert skipped == 3
+
+    def test_no_filters_passes_everything(self, tmp_output_dir):
+        """With no filters or completions, every object becomes an item."""
+        tracker = ProgressTracker(tmp_output_dir)
+
+        items, skipped = filter_objects(self._objects(), prefix="", tracker=tracker)
+
+        assert len(items) == 4
+        assert skipped == 0
+        assert items[0].etag == "abc"  # Quote-stripped by make_download_item
+
+
+class TestPrepareOutputTree:
+    """Test up-front output directory creation."""
+
+    def test_creates_unique_parents(self, tmp_output_dir):
+        """Every distinct parent directory should exist after one call."""
+        items = [
+            DownloadItem(key="dois/a/f1.json", size=1, etag="a", relative_path="a/f1.json"),
+            DownloadItem(key="dois/a/f2.json", size=1, etag="b", relative_path="a/f2.json"),
+            DownloadItem(key="dois/b/c/f3.json", size=1, etag="c", relative_path="b/c/f3.json"),
+        ]
+
+        prepare_output_tree(items, tmp_output_dir)
+
+        assert (tmp_output_dir / "a").is_dir()
+        assert (tmp_output_dir / "b" / "c").is_dir()
+
+    def test_unsafe_items_are_skipped(self, tmp_output_dir):
+        """Traversal attempts don't abort tree creation for valid items."""
+        items = [
+            DownloadItem(key="x", size=1, etag="a", relative_path="../escape/f.json"),
+            DownloadItem(key="y", size=1, etag="b", relative_path="ok/f.json"),
+        ]
+
+        prepare_output_tree(items, tmp_output_dir)
+
+        assert (tmp_output_dir / "ok").is_dir()
+        assert not (tmp_output_dir.parent / "escape").exists()
+
+
 class TestGetManifestMetadata:
     """Test MANIFEST metadata retrieval."""
 
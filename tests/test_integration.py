@@ -1,15 +1,24 @@
 """Integration tests with mocked S3."""
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest.mock import patch
+
+import pytest
 
 from datacite_data_file_dl.download import (
+    BUCKET,
+    clear_list_cache,
     list_contents,
     list_all_objects,
     download_file_with_retry,
     download_worker,
+    make_download_item,
 )
 from datacite_data_file_dl.progress import AggregateProgress, ProgressTracker
 
+# Everything here stands up a moto backend; deselect with -m 'not integration'
+pytestmark = pytest.mark.integration
+
 
 class TestListContents:
     """Test S3 listing operations."""
@@ -35,6 +44,19 @@ class TestListContents:
         assert folders == []
         assert files == []
 
+    def test_list_contents_cached(self, populated_s3):
+        """Back-to-back listings of the same prefix should hit the cache."""
+        clear_list_cache()
+        with patch.object(
+            populated_s3, "get_paginator", wraps=populated_s3.get_paginator
+        ) as spy:
+            first = list_contents(populated_s3, "dois/")
+            second = list_contents(populated_s3, "dois/")
+
+        assert first == second
+        assert spy.call_count == 1
+        clear_list_cache()
+
 
 class TestListAllObjects:
     """Test recursive object listing."""
@@ -66,6 +88,98 @@ class TestDownloadWithRetry:
         assert local_path.exists()
         assert local_path.read_text() == "manifest content"
 
+    def test_checksum_computed_during_download(self, populated_s3, tmp_output_dir):
+        """Small single-part objects verify inline, with no second read pass."""
+        import hashlib
+
+        etag = hashlib.md5(b"manifest content").hexdigest()
+        local_path = tmp_output_dir / "MANIFEST"
+
+        with patch("datacite_data_file_dl.download.verify_checksum") as verify:
+            download_file_with_retry(
+                client=populated_s3,
+                s3_key="MANIFEST",
+                local_path=local_path,
+                expected_etag=etag,
+                size=len(b"manifest content"),
+                progress=False,
+            )
+
+        verify.assert_not_called()
+        assert local_path.read_text() == "manifest content"
+
+    def test_inline_checksum_mismatch_raises(self, populated_s3, tmp_output_dir):
+        """A wrong ETag on the streaming path still raises ChecksumMismatch."""
+        from datacite_data_file_dl.checksum import ChecksumMismatch
+
+        local_path = tmp_output_dir / "MANIFEST"
+
+        with pytest.raises(ChecksumMismatch):
+            download_file_with_retry(
+                client=populated_s3,
+                s3_key="MANIFEST",
+                local_path=local_path,
+                expected_etag="0" * 32,
+                size=len(b"manifest content"),
+                progress=False,
+            )
+
+        assert not local_path.exists()
+
+    def test_download_multipart_sized_file(self, populated_s3, tmp_output_dir):
+        """Objects above the multipart threshold download via ranged GETs."""
+        # One byte past TRANSFER_CONFIG's 16 MiB threshold
+        payload = b"x" * (16 * 1024 * 1024 + 1)
+        populated_s3.put_object(Bucket=BUCKET, Key="dois/large.json", Body=payload)
+        local_path = tmp_output_dir / "large.json"
+
+        download_file_with_retry(
+            client=populated_s3,
+            s3_key="dois/large.json",
+            local_path=local_path,
+            progress=False,
+        )
+
+        assert local_path.stat().st_size == len(payload)
+        assert local_path.read_bytes() == payload
+
+    def test_resumes_partial_temp_file(self, populated_s3, tmp_output_dir):
+        """Should append only the missing bytes to a leftover temp file."""
+        import hashlib
+
+        local_path = tmp_output_dir / "MANIFEST"
+        temp_path = tmp_output_dir / "MANIFEST.tmp"
+        temp_path.write_text("manifest")  # First 8 bytes already on disk
+
+        etag = hashlib.md5(b"manifest content").hexdigest()
+        download_file_with_retry(
+            client=populated_s3,
+            s3_key="MANIFEST",
+            local_path=local_path,
+            expected_etag=etag,
+            progress=False,
+        )
+
+        assert local_path.read_text() == "manifest content"
+        assert not temp_path.exists()
+
+    def test_restarts_when_partial_is_stale(self, populated_s3, tmp_output_dir):
+        """Should discard the temp file and restart when the ETag changed."""
+        local_path = tmp_output_dir / "MANIFEST"
+        temp_path = tmp_output_dir / "MANIFEST.tmp"
+        temp_path.write_text("old partial data")
+
+        download_file_with_retry(
+            client=populated_s3,
+            s3_key="MANIFEST",
+            local_path=local_path,
+            expected_etag="0" * 32,  # Does not match the stored object
+            skip_verify=True,
+            progress=False,
+        )
+
+        assert local_path.read_text() == "manifest content"
+
     def test_download_with_progress_tracking(self, populated_s3, tmp_output_dir):
         """Should integrate with progress tracker."""
         tracker = ProgressTracker(tmp_output_dir)
@@ -106,9 +220,8 @@ class TestParallelDownload:
                 executor.submit(
                     download_worker,
                     client=populated_s3,
-                    obj=obj,
+                    item=make_download_item(obj, "dois/"),
                     output_dir=str(tmp_output_dir),
-                    prefix="dois/",
                     retries=3,
                     skip_verify=True,
                     aggregate_progress=aggregate_progress,
@@ -152,9 +265,8 @@ class TestParallelDownload:
                 executor.submit(
                     download_worker,
                     client=populated_s3,
-                    obj=obj,
+                    item=make_download_item(obj, ""),
                     output_dir=str(tmp_output_dir),
-                    prefix="",
                     retries=1,
                     skip_verify=True,
                     aggregate_progress=aggregate_progress,
@@ -189,9 +301,8 @@ class TestParallelDownload:
 
         result = download_worker(
             client=populated_s3,
-            obj=obj,
+            item=make_download_item(obj, ""),
             output_dir=str(tmp_output_dir),
-            prefix="",
             retries=3,
             skip_verify=True,
             aggregate_progress=aggregate_progress,
@@ -2,7 +2,7 @@
 
 import logging
 
-from datacite_data_file_dl.log import setup_logging, get_logger
+from datacite_data_file_dl.log import setup_logging, get_logger, logger as module_logger
 
 
 def test_setup_logging_default_level():
@@ -30,3 +30,9 @@ def test_get_logger_returns_named_logger():
     """get_logger should return the datacite-data-file-dl logger."""
     logger = get_logger()
     assert logger.name == "datacite-data-file-dl"
+
+
+def test_get_logger_is_identity():
+    """Every access resolves to the one module-level Logger instance."""
+    assert get_logger() is get_logger()
+    assert get_logger() is module_logger
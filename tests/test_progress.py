@@ -44,6 +44,59 @@ class TestProgressTracker:
         assert not tracker.is_complete("file1.json")
         assert tracker.get_completed_files() == []
 
+    def test_mark_complete_many(self, tmp_output_dir):
+        """Should mark a batch of files complete with one checkpoint."""
+        tracker = ProgressTracker(tmp_output_dir)
+        tracker.mark_complete_many(
+            [
+                ("file1.json", 1000, "abc"),
+                ("file2.json", 2000, "def"),
+            ]
+        )
+
+        assert tracker.is_complete("file1.json")
+        assert tracker.is_complete("file2.json")
+
+        tracker2 = ProgressTracker(tmp_output_dir)
+        assert len(tracker2.get_completed_files()) == 2
+
+    def test_progress_snapshot_is_compressed(self, tmp_output_dir):
+        """Snapshots are gzipped on disk and round-trip through a new tracker."""
+        tracker = ProgressTracker(tmp_output_dir)
+        tracker.mark_complete("file1.json", size=1000, checksum="abc")
+        tracker.save()
+
+        raw = tracker.progress_file.read_bytes()
+        assert raw[:2] == b"\x1f\x8b"  # gzip magic
+
+        tracker2 = ProgressTracker(tmp_output_dir)
+        assert tracker2.is_complete("file1.json")
+
+    def test_loads_legacy_uncompressed_snapshot(self, tmp_output_dir):
+        """Plain-JSON snapshots from older versions still load."""
+        import json
+
+        legacy = tmp_output_dir / ".datacite-data-file-dl-progress.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "files": [
+                        {
+                            "path": "old.json",
+                            "size": 10,
+                            "checksum": "abc",
+                            "completed": True,
+                            "completed_at": None,
+                        }
+                    ],
+                }
+            )
+        )
+
+        tracker = ProgressTracker(tmp_output_dir)
+        assert tracker.is_complete("old.json")
+
     def test_stats(self, tmp_output_dir):
         """Should track download statistics."""
         tracker = ProgressTracker(tmp_output_dir)
@@ -79,6 +132,11 @@ class TestFileStatus:
         assert status.path == "test.json"
         assert status.size == 1000
 
+    def test_slots_no_instance_dict(self):
+        """slots=True keeps per-instance dicts out of million-entry trackers."""
+        status = FileStatus(path="test.json", size=1000, checksum="abc123")
+        assert not hasattr(status, "__dict__")
+
 
 class TestProgressTrackerThreadSafety:
     """Test thread-safety of ProgressTracker."""
@@ -72,6 +72,24 @@ class TestRetryWithBackoff:
 
         assert call_count == 1
 
+    def test_non_retryable_clienterror_skipped(self):
+        """Fatal S3 error codes should propagate without any retry."""
+        call_count = 0
+
+        @retry_with_backoff(max_retries=3, base_delay=0.01)
+        def missing_key():
+            nonlocal call_count
+            call_count += 1
+            raise ClientError(
+                {"Error": {"Code": "NoSuchKey", "Message": "Not found"}},
+                "GetObject",
+            )
+
+        with pytest.raises(ClientError):
+            missing_key()
+
+        assert call_count == 1
+
     def test_zero_retries_means_no_retry(self):
         """With max_retries=0, should not retry at all."""
         call_count = 0
@@ -88,6 +106,50 @@ class TestRetryWithBackoff:
         assert call_count == 1
 
 
+class TestJitterModes:
+    """Test the jitter schedule options."""
+
+    def test_decorrelated_sleeps_never_exceed_cap(self):
+        """Decorrelated jitter must respect max_delay on every sleep."""
+        sleeps = []
+
+        @retry_with_backoff(
+            max_retries=8,
+            base_delay=0.5,
+            max_delay=2.0,
+            jitter="decorrelated",
+        )
+        def always_fails():
+            raise ConnectionError("fail")
+
+        with patch("datacite_data_file_dl.retry.time.sleep", side_effect=sleeps.append):
+            with pytest.raises(RetryExhausted):
+                always_fails()
+
+        assert len(sleeps) == 7
+        assert all(0.5 <= delay <= 2.0 for delay in sleeps)
+
+    def test_bool_aliases_accepted(self):
+        """True/False keep working as aliases for full/none jitter."""
+        sleeps = []
+
+        @retry_with_backoff(max_retries=3, base_delay=1.0, jitter=False)
+        def always_fails():
+            raise ConnectionError("fail")
+
+        with patch("datacite_data_file_dl.retry.time.sleep", side_effect=sleeps.append):
+            with pytest.raises(RetryExhausted):
+                always_fails()
+
+        # Without jitter the schedule is the raw exponential sequence
+        assert sleeps == [1.0, 2.0]
+
+    def test_unknown_mode_rejected(self):
+        """An unrecognized jitter mode should fail at decoration time."""
+        with pytest.raises(ValueError):
+            retry_with_backoff(jitter="bogus")
+
+
 class TestRetryWithCredentialRefresh:
     """Tests for retry_with_credential_refresh function."""
 
@@ -249,3 +311,37 @@ class TestRetryWithCredentialRefresh:
 
         assert call_count >= 3
         assert cred_manager.refresh_count == 2
+
+    @patch("datacite_data_file_dl.auth.fetch_credentials")
+    @patch("datacite_data_file_dl.auth.boto3.client")
+    def test_access_denied_fatal_after_refresh(self, mock_boto_client, mock_fetch):
+        """AccessDenied gets its one refresh, then propagates without retries."""
+        from datacite_data_file_dl.auth import AWSCredentials, CredentialManager
+
+        mock_fetch.side_effect = [
+            AWSCredentials("key1", "secret1", "token1"),
+            AWSCredentials("key2", "secret2", "token2"),
+        ]
+        mock_boto_client.side_effect = [MagicMock(), MagicMock()]
+
+        cred_manager = CredentialManager("user", "pass")
+        call_count = 0
+
+        def always_denied(client):
+            nonlocal call_count
+            call_count += 1
+            raise ClientError(
+                {"Error": {"Code": "AccessDenied", "Message": "Denied"}},
+                "GetObject",
+            )
+
+        with pytest.raises(ClientError):
+            retry_with_credential_refresh(
+                always_denied,
+                credential_manager=cred_manager,
+                max_retries=5,
+                base_delay=0.01,
+            )
+
+        # One pre-refresh call, one post-refresh call, no backoff loop
+        assert call_count == 2